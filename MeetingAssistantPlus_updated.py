@@ -1,7 +1,13 @@
+import abc
+import array
 import asyncio
 import base64
+import collections
 import datetime
+import hashlib
 import json
+import math
+import multiprocessing
 import os
 import re
 import sys
@@ -9,6 +15,7 @@ import threading
 import time
 
 from io import BytesIO
+from urllib.parse import urlparse
 from qasync import QEventLoop, asyncSlot
 
 def load_settings():
@@ -66,6 +73,38 @@ DEFAULT_LINE_SPACING = 150  # percentage
 DEFAULT_WORD_SPACING = 1.2  # multiplier
 DEFAULT_POLL_INTERVAL = 5   # seconds
 DEFAULT_CODE_WORD = "blossom"
+DEFAULT_STORAGE_STATE_PATH = "otter_storage_state.json"  # Saved Otter cookies and local storage
+DEFAULT_DEDUP_WINDOW = 5000  # recent line identities remembered per meeting
+DEFAULT_RECONCILE_WINDOW = 8  # trailing lines Otter may still rewrite
+DEFAULT_ANALYSIS_TIMEOUT = 30  # seconds before an analysis request is abandoned
+DEFAULT_RESPONSE_CACHE_PATH = "response_cache"  # directory for the on-disk analysis response cache
+ANALYSIS_SCHEDULE_CHECK_MS = 5000  # how often the time-based analysis trigger is checked
+
+# Per-step readiness timeouts (seconds) used while opening a meeting
+DEFAULT_STARTUP_TIMEOUTS = {
+    "navigate": 90,
+    "render": 30,
+    "login": 180,
+    "cookies": 5,
+    "transcript": 30,
+}
+
+# Resource types the meeting page may load; images, fonts, media and beacons are blocked
+DEFAULT_ALLOWED_RESOURCE_TYPES = [
+    "document", "script", "stylesheet", "xhr", "fetch", "websocket", "eventsource", "other",
+]
+# Hosts that always load in full, so sign-in and CAPTCHA widgets keep working
+DEFAULT_ALLOWED_DOMAINS = ["accounts.google.com", "www.google.com", "www.gstatic.com", "recaptcha.net"]
+# Analytics and marketing hosts blocked whatever the resource type
+DEFAULT_BLOCKED_DOMAINS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "facebook.net",
+    "segment.io", "segment.com", "hotjar.com", "intercom.io", "mixpanel.com", "amplitude.com",
+    "hubspot.com", "hs-scripts.com", "fullstory.com", "heapanalytics.com", "clarity.ms",
+]
+# Typical transfer sizes (bytes) used to estimate what blocked requests would have cost
+TYPICAL_RESOURCE_BYTES = {
+    "image": 30000, "font": 50000, "media": 500000, "script": 80000, "stylesheet": 20000,
+}
 
 # --------------------------
 # Default model configuration
@@ -77,6 +116,15 @@ AVAILABLE_MODELS = [
     "mixtral-8x7b-32768",
     "gemma-7b-it"
 ]
+# Context window (tokens) per model; unknown models fall back to a -NNNN name suffix, then the default
+MODEL_CONTEXT_WINDOWS = {
+    "llama3-70b-8192": 8192,
+    "llama3-8b-8192": 8192,
+    "mixtral-8x7b-32768": 32768,
+    "gemma-7b-it": 8192,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+DEFAULT_ANALYSIS_MAX_TOKENS = 1024  # completion tokens reserved for each analysis
 
 # --------------------------
 # Theme definitions
@@ -204,8 +252,56 @@ TOPIC SUMMARY: [Brief summary of the current topic]
 """
     }],
     "summary_line_interval": 10,
-    "summary_time_interval": 120,
+    "summary_time_interval": 120,  # seconds; analysis also runs this often while lines keep arriving
+    "analysis_min_spacing": 20,  # seconds between analyses, whatever triggers them
+    "analysis_timeout": DEFAULT_ANALYSIS_TIMEOUT,
+    "analysis_max_retries": 1,
+    "stream_analysis": True,  # Render AI output into the panels token by token
+    "fanout_prompts": [],  # Names of saved prompts to run alongside the active prompt on every analysis
+    "fanout_parallelism": 3,  # analysis requests in flight at once
+    "stale_analysis_lines": 20,  # new lines that make a running analysis stale enough to cancel and restart
+    "rolling_context": True,  # Send a running summary plus recent lines instead of the whole transcript
+    "context_recent_lines": 20,  # lines always sent verbatim
+    "context_max_recent_lines": 80,  # older lines since the last analysis are folded into the summary
+    "summary_chunk_lines": 200,  # lines folded into the summary per summary request
+    "summary_max_words": 250,
+    "summary_model": "",  # Empty uses the analysis model
+    "response_cache": True,  # Reuse the answer to an identical analysis request
+    "response_cache_entries": 64,
+    "response_cache_disk_mb": 0,  # Also keep responses on disk across runs, up to this size; 0 disables
+    "response_cache_path": DEFAULT_RESPONSE_CACHE_PATH,
+    "model_context_windows": {},  # context window (tokens) for models missing from MODEL_CONTEXT_WINDOWS
+    "token_safety_margin": 0.1,  # share of the context window kept free for token estimate error
+    "groq_base_url": "",  # Empty uses the Groq API (or GROQ_BASE_URL)
     "poll_interval": DEFAULT_POLL_INTERVAL,
+    "dedup_window": DEFAULT_DEDUP_WINDOW,
+    "reconnect_after_errors": 3,  # failed polls in a row before the page is reopened
+    "reconnect_initial_delay": 2,  # seconds; doubles after each failed attempt
+    "reconnect_max_delay": 60,
+    "scraper_process": False,  # Run the browser and ingestion in a separate process; the GUI only renders
+    "measure_ui_latency": False,  # Debug: sample GUI frame latency while monitoring (wakes the GUI every 16 ms)
+    "scroll_harvest": True,  # Scroll back through long transcripts to pick up lines outside the view
+    "reconcile_window": DEFAULT_RECONCILE_WINDOW,
+    "source_poll_interval": 0.5,  # seconds between reads of a transcript file or replay
+    "replay_speed": 1.0,  # 1x to 100x; a replay:path@10x target overrides it
+    "adaptive_polling": True,  # Poll faster while lines arrive and back off while the meeting is quiet
+    "poll_interval_min": 1,  # seconds
+    "poll_interval_max": 20,  # seconds
+    "poll_backoff": 2.0,  # interval multiplier for each poll that finds no new lines
+    "batched_extraction": True,  # Pull all transcript lines in one page call per poll
+    "push_capture": True,  # Stream new lines from an in-page observer instead of waiting for the poll
+    "push_debounce_ms": 150,
+    "consistency_check_interval": 30,  # seconds between full polls while push capture is active
+    "network_capture": True,  # Decode transcript lines from Otter's API and WebSocket traffic when available
+    "network_stall_timeout": 30,  # seconds without network-decoded lines before page capture takes over again
+    "headless_when_authenticated": True,  # Run the browser hidden once a saved Otter login exists
+    "storage_state_path": DEFAULT_STORAGE_STATE_PATH,
+    "startup_timeouts": {},  # per-step overrides (seconds) for DEFAULT_STARTUP_TIMEOUTS
+    "prelaunch_browser": True,  # Start Playwright and the browser with the app so Start only opens a page
+    "resource_filter": True,  # Block page resources the transcript does not need
+    "allowed_resource_types": DEFAULT_ALLOWED_RESOURCE_TYPES,
+    "allowed_domains": DEFAULT_ALLOWED_DOMAINS,
+    "blocked_domains": DEFAULT_BLOCKED_DOMAINS,
     "theme": "macOS",  # Default to macOS theme
     "start_in_background": False,
     "font_size": DEFAULT_FONT_SIZE,
@@ -310,6 +406,1438 @@ def create_icon_button(icon, tooltip=None, size=32):
         }
     """)
     return btn
+
+# --------------------------
+# Transcript Extraction
+# --------------------------
+TRANSCRIPT_CONTAINER_SELECTOR = "#__next .transcriptContainer, .transcript-container"
+LOGIN_FORM_SELECTOR = "input[type='password'], input[type='email']"
+COOKIE_ACCEPT_SELECTOR = "button:has-text('Accept'), button:has-text('Accept All'), button:has-text('Allow')"
+TRANSCRIPT_LINE_SELECTOR = "#__next .transcriptContainer .line, .transcript-container .transcript-element"
+
+# Page-side helper that turns one transcript line element into a structured record
+TRANSCRIPT_RECORD_JS = r"""
+const timePattern = /\b(\d{1,2}:\d{2}:\d{2})\b/;
+function extractLineRecord(el) {
+    const raw = (el.innerText || "").trim();
+    if (!raw) {
+        return null;
+    }
+    const speakerEl = el.querySelector(".speaker-name, .transcript-speaker, .speaker");
+    const timeEl = el.querySelector(".timestamp, .transcript-timestamp, .time");
+    const textEl = el.querySelector(".transcript-text, .line-text, .text");
+    const speaker = speakerEl ? speakerEl.innerText.trim() : "";
+    const timeMatch = (timeEl ? timeEl.innerText : raw).match(timePattern);
+    let text = textEl ? textEl.innerText.trim() : raw;
+    if (!textEl) {
+        if (timeMatch) {
+            text = text.replace(timeMatch[1], "");
+        }
+        if (speaker && text.trim().startsWith(speaker)) {
+            text = text.trim().slice(speaker.length);
+        }
+        text = text.trim();
+    }
+    return {
+        id: el.getAttribute("data-line-id") || el.getAttribute("data-id") || el.id || null,
+        speaker: speaker,
+        timestamp: timeMatch ? timeMatch[1] : "",
+        text: text
+    };
+}
+"""
+
+# Returns every transcript line in one round trip
+TRANSCRIPT_EXTRACT_JS = "(selector) => {" + TRANSCRIPT_RECORD_JS + r"""
+    return Array.from(document.querySelectorAll(selector)).map(extractLineRecord).filter(Boolean);
+}
+"""
+
+# Installs a MutationObserver that pushes added or changed lines to an exposed Python binding
+TRANSCRIPT_OBSERVER_JS = "([selector, bindingName, debounceMs]) => {" + TRANSCRIPT_RECORD_JS + r"""
+    if (window.__mapObserver) {
+        window.__mapObserver.disconnect();
+    }
+    const pending = new Set();
+    let flushTimer = null;
+    const flush = () => {
+        flushTimer = null;
+        const records = [];
+        pending.forEach((el) => {
+            const record = el.isConnected ? extractLineRecord(el) : null;
+            if (record) {
+                records.push(record);
+            }
+        });
+        pending.clear();
+        if (records.length) {
+            window[bindingName](records);
+        }
+    };
+    const lineFor = (node) => {
+        const el = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+        return el ? el.closest(selector) : null;
+    };
+    const observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            const changed = lineFor(mutation.target);
+            if (changed) {
+                pending.add(changed);
+            }
+            mutation.addedNodes.forEach((node) => {
+                if (node.nodeType !== Node.ELEMENT_NODE) {
+                    return;
+                }
+                if (node.matches(selector)) {
+                    pending.add(node);
+                }
+                node.querySelectorAll(selector).forEach((el) => pending.add(el));
+            });
+        }
+        if (pending.size && !flushTimer) {
+            flushTimer = setTimeout(flush, debounceMs);
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    window.__mapObserver = observer;
+    return true;
+}
+"""
+
+TRANSCRIPT_PUSH_BINDING = "__mapTranscriptPush"
+
+# Scrolls the transcript's scrollable ancestor (a null position only measures) and waits
+# two frames so the virtualized list can mount the rows now in view
+TRANSCRIPT_SCROLL_JS = r"""async ([containerSelector, lineSelector, position]) => {
+    let scroller = document.querySelector(containerSelector);
+    while (scroller && scroller !== document.body && scroller.scrollHeight <= scroller.clientHeight) {
+        scroller = scroller.parentElement;
+    }
+    if (!scroller || scroller === document.body) {
+        scroller = document.scrollingElement;
+    }
+    if (position !== null) {
+        scroller.scrollTop = position;
+        await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    }
+    const lines = document.querySelectorAll(lineSelector);
+    let lineHeight = 0;
+    lines.forEach((el) => { lineHeight += el.offsetHeight; });
+    return {
+        top: scroller.scrollTop,
+        height: scroller.scrollHeight,
+        view: scroller.clientHeight,
+        estimatedLines: lineHeight ? Math.round(scroller.scrollHeight / (lineHeight / lines.length)) : lines.length
+    };
+}"""
+
+def format_transcript_record(record):
+    """Format a structured transcript record as a display line."""
+    text = record.get("text", "")
+    if record.get("speaker"):
+        text = f"{record['speaker']}: {text}"
+    if record.get("timestamp"):
+        return f"[{record['timestamp']}] {text}"
+    return text
+
+def normalize_transcript_line(line):
+    """Move a bare h:mm:ss timestamp in a scraped line to a leading [h:mm:ss] prefix."""
+    if line.startswith('['):
+        return line
+    time_match = re.search(r'\b(\d{1,2}:\d{2}:\d{2})\b', line)
+    if not time_match:
+        return line
+    text = re.sub(r'\b\d{1,2}:\d{2}:\d{2}\b', '', line).strip()
+    return f"[{time_match.group(1)}] {text}"
+
+def line_text_record(line_text):
+    """Wrap a line scraped as plain text in a transcript record."""
+    line = normalize_transcript_line(line_text)
+    timestamp = ""
+    if line.startswith('[') and ']' in line:
+        timestamp, line = line[1:line.index(']')], line[line.index(']') + 1:].strip()
+    return {"id": None, "speaker": "", "timestamp": timestamp, "text": line}
+
+def line_identity(record):
+    """Stable 16-byte identity for a line: Otter's line ID, else speaker, timestamp and text."""
+    if record.get("id"):
+        key = "id\x1f" + str(record["id"])
+    else:
+        key = "\x1f".join((record.get("speaker") or "", record.get("timestamp") or "", record.get("text") or ""))
+    # blake2b rather than hash(), which is salted per process and only 64 bits wide
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+def content_record(record):
+    """A record keyed by what was said rather than by a capture source's line ID and timestamp format."""
+    start = record.get("start")
+    if start is None:
+        start = parse_timestamp(record.get("timestamp"))
+    return dict(
+        record,
+        id=None,
+        start=start,
+        timestamp=format_timestamp(start) if start is not None else "",
+        text=" ".join((record.get("text") or "").split())
+    )
+
+class LineIdentityIndex:
+    """Remembers the identities of the most recent transcript lines in bounded memory."""
+
+    def __init__(self, window=DEFAULT_DEDUP_WINDOW):
+        self.window = window
+        self.order = collections.deque()
+        self.keys = set()
+
+    def add(self, key):
+        """Record a line identity; returns False if it is already in the window."""
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self.order.append(key)
+        if len(self.order) > self.window:
+            self.keys.discard(self.order.popleft())
+        return True
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def __len__(self):
+        return len(self.order)
+
+def is_line_revision(old_text, new_text, min_length=12):
+    """Whether new_text extends or trims old_text, as Otter does while it refines a line."""
+    old = " ".join(re.findall(r"\w+", old_text.lower()))
+    new = " ".join(re.findall(r"\w+", new_text.lower()))
+    if min(len(old), len(new)) < min_length:
+        return False
+    return new.startswith(old) or old.startswith(new)
+
+def revises_line(previous, record):
+    """Whether a record is a later version of the committed line previous."""
+    if record.get("id") and previous.get("id"):
+        return record["id"] == previous["id"]
+    if (record.get("speaker") or "") != (previous.get("speaker") or ""):
+        return False
+    # Never on the timestamp alone: one speaker often says several sentences within the same second
+    timestamp = record.get("timestamp") or ""
+    if timestamp != (previous.get("timestamp") or ""):
+        return False
+    # Untimed short lines ("Yes.", "Okay") are too ambiguous to merge on text alone
+    return is_line_revision(previous.get("text") or "", record.get("text") or "", 1 if timestamp else 12)
+
+def match_revised_line(record, recent_lines):
+    """Find the recent [record, index] entry a record revises: its Otter line ID, or the speaker's latest line."""
+    speaker = record.get("speaker") or ""
+    for entry in reversed(recent_lines):
+        previous = entry[0]
+        if record.get("id") and previous.get("id"):
+            if record["id"] == previous["id"]:
+                return entry
+        elif speaker == (previous.get("speaker") or ""):
+            # Only the speaker's latest line can still be growing
+            return entry if revises_line(previous, record) else None
+    return None
+
+def align_snapshot(records, keys, recent_lines):
+    """Index of the record showing the newest committed line, or None if the records do not reach back to it."""
+    tail = [entry[0] for entry in recent_lines]
+    tail_keys = [line_identity(record) for record in tail]
+    if not tail_keys or not records:
+        return None
+
+    def shows_tail(position):
+        # Each committed line must be shown unchanged or as Otter's revision of it
+        for back in range(min(position + 1, len(tail_keys))):
+            shown = position - back
+            if keys[shown] != tail_keys[-1 - back] and not revises_line(tail[-1 - back], records[shown]):
+                return False
+        return True
+
+    # The earliest place the whole tail appears, so a repeated "Yes." after it still counts as new
+    for position in range(len(tail_keys) - 1, len(records)):
+        if shows_tail(position):
+            return position
+    # Otherwise the records may start part way through the tail; take the longest overlap
+    for position in range(min(len(tail_keys) - 1, len(records)) - 1, -1, -1):
+        if shows_tail(position):
+            return position
+    return None
+
+async def extract_transcript_records(page):
+    """Extract every transcript line as a structured record in a single page call."""
+    return await page.evaluate(TRANSCRIPT_EXTRACT_JS, TRANSCRIPT_LINE_SELECTOR)
+
+async def extract_transcript_lines_per_element(page):
+    """Extract transcript lines one element at a time (one round trip per line)."""
+    lines = []
+    for element in await page.query_selector_all(TRANSCRIPT_LINE_SELECTOR):
+        try:
+            line_text = (await element.inner_text()).strip()
+            if line_text:
+                lines.append(line_text)
+        except Exception as e:
+            print(f"[DEBUG] Error processing transcript line: {e}")
+    return lines
+
+async def scroll_transcript(page, position=None):
+    """Scroll the transcript to a position, or just measure it, and return its scroll state."""
+    return await page.evaluate(
+        TRANSCRIPT_SCROLL_JS, [TRANSCRIPT_CONTAINER_SELECTOR, TRANSCRIPT_LINE_SELECTOR, position]
+    )
+
+async def harvest_transcript_records(page, is_known, max_steps=500):
+    """Scroll up through a virtualized transcript in view-sized chunks, collecting lines in document order."""
+    start = await scroll_transcript(page)
+    state = start
+    position = start["top"]
+    chunks = []
+    for _ in range(max_steps):
+        records = await extract_transcript_records(page)
+        chunks.append(records)
+        # Stop once this chunk overlaps lines we already have, or at the top of the transcript
+        if position <= 0 or any(is_known(record) for record in records):
+            break
+        position = max(0, position - int(state["view"] * 0.8))
+        state = await scroll_transcript(page, position)
+
+    # Put the view back; if it was following the live end, keep following it
+    at_bottom = start["top"] + start["view"] >= start["height"] - 2
+    state = await scroll_transcript(page, start["height"] if at_bottom else start["top"])
+
+    ordered = []
+    collected = set()
+    for records in reversed(chunks):
+        for record in records:
+            key = line_identity(record)
+            if key not in collected:
+                collected.add(key)
+                ordered.append(record)
+    return ordered, len(chunks), state
+
+def next_poll_interval(current, new_lines, minimum, maximum, backoff):
+    """Drop to the minimum interval while lines arrive and back off exponentially while it is quiet."""
+    if new_lines:
+        return minimum
+    return min(maximum, max(minimum, current * backoff))
+
+# --------------------------
+# Resource Filtering
+# --------------------------
+def host_matches(host, domains):
+    """Whether a host is one of the domains or a subdomain of one."""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+def should_block_request(resource_type, url, allowed_types, allowed_domains, blocked_domains):
+    """Decide whether the resource filter aborts a request; domain rules win over type rules."""
+    host = urlparse(url).hostname or ""
+    if host_matches(host, blocked_domains):
+        return True
+    if host_matches(host, allowed_domains):
+        return False
+    return resource_type not in allowed_types
+
+# --------------------------
+# Network Transcript Decoding
+# --------------------------
+TRANSCRIPT_URL_PATTERN = re.compile(r"otter\.ai/.*(speech|transcript|conversation|live)", re.IGNORECASE)
+
+def format_timestamp(seconds):
+    """Format a number of seconds as h:mm:ss."""
+    h, remainder = divmod(int(seconds), 3600)
+    m, s = divmod(remainder, 60)
+    return f"{h}:{m:02}:{s:02}"
+
+def decode_socket_frame(payload):
+    """Decode a JSON WebSocket frame, skipping any Socket.IO packet prefix."""
+    if isinstance(payload, bytes):
+        try:
+            payload = payload.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+    payload = re.sub(r'^\d+', '', payload)
+    if not payload:
+        return None
+    try:
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+def segment_offset(segment, *keys):
+    """Read a segment time in seconds; *_offset fields are milliseconds, the rest seconds."""
+    for key in keys:
+        value = segment.get(key)
+        if isinstance(value, (int, float)):
+            return value / 1000.0 if key.endswith("_offset") else float(value)
+    return None
+
+def parse_transcript_payload(payload):
+    """Find transcript segments anywhere in a decoded Otter payload."""
+    # Speaker names usually come in a separate list keyed by speaker ID
+    speaker_names = {}
+    segments = []
+    stack = [payload]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, dict):
+            if "speaker_name" in item and ("speaker_id" in item or "id" in item):
+                speaker_names[item.get("speaker_id", item.get("id"))] = item["speaker_name"]
+            text = item.get("transcript", item.get("text"))
+            if isinstance(text, str) and text.strip() and segment_offset(
+                item, "start_offset", "start_time", "start"
+            ) is not None:
+                segments.append(item)
+            else:
+                stack.extend(reversed(list(item.values())))
+
+    records = []
+    for segment in segments:
+        start = segment_offset(segment, "start_offset", "start_time", "start")
+        speaker = segment.get("speaker_name") or speaker_names.get(segment.get("speaker_id"), "")
+        if not speaker and isinstance(segment.get("speaker"), str):
+            speaker = segment["speaker"]
+        segment_id = segment.get("id", segment.get("uuid"))
+        records.append({
+            "id": str(segment_id) if segment_id is not None else None,
+            "speaker": speaker,
+            "timestamp": format_timestamp(start),
+            "start": start,
+            "end": segment_offset(segment, "end_offset", "end_time", "end"),
+            "text": segment.get("transcript", segment.get("text")).strip(),
+        })
+    return records
+
+# --------------------------
+# Transcript Store
+# --------------------------
+def parse_timestamp(timestamp):
+    """Convert an h:mm:ss or mm:ss timestamp to seconds, or None if it is missing or malformed."""
+    if not timestamp:
+        return None
+    try:
+        seconds = 0
+        for part in timestamp.split(":"):
+            seconds = seconds * 60 + int(part)
+    except ValueError:
+        return None
+    return float(seconds)
+
+def format_srt_time(seconds):
+    """Format seconds as an SRT hh:mm:ss,mmm time."""
+    milliseconds = int(round(seconds * 1000))
+    h, remainder = divmod(milliseconds, 3600000)
+    m, remainder = divmod(remainder, 60000)
+    s, ms = divmod(remainder, 1000)
+    return f"{h:02}:{m:02}:{s:02},{ms:03}"
+
+class TranscriptLine:
+    """One transcript line, parsed once at ingestion."""
+
+    __slots__ = ("id", "speaker", "start", "end", "text")
+
+    def __init__(self, id=None, speaker="", start=None, end=None, text=""):
+        self.id = id
+        self.speaker = speaker
+        self.start = start  # seconds from the start of the meeting
+        self.end = end
+        self.text = text
+
+    @classmethod
+    def from_record(cls, record):
+        """Build a line from an extracted or network-decoded record."""
+        start = record.get("start")
+        if start is None:
+            start = parse_timestamp(record.get("timestamp"))
+        return cls(record.get("id"), record.get("speaker") or "", start, record.get("end"), record.get("text") or "")
+
+    @property
+    def timestamp(self):
+        """The start time as h:mm:ss, or an empty string."""
+        return format_timestamp(self.start) if self.start is not None else ""
+
+    def content(self):
+        """Speaker and text without the timestamp."""
+        return f"{self.speaker}: {self.text}" if self.speaker else self.text
+
+    def display_text(self):
+        """The line as shown and exported: [h:mm:ss] Speaker: text."""
+        if self.start is None:
+            return self.content()
+        return f"[{self.timestamp}] {self.content()}"
+
+    def fields(self):
+        """The line as a plain tuple, cheap to pickle across a process pipe."""
+        return (self.id, self.speaker, self.start, self.end, self.text)
+
+class TranscriptStore:
+    """Array-backed transcript holding one column per TranscriptLine field."""
+
+    def __init__(self):
+        self.ids = []
+        self.speakers = []
+        self.starts = array.array("d")  # NaN where a line has no time
+        self.ends = array.array("d")
+        self.texts = []
+        self.tokens = array.array("l")  # estimated display-line tokens, -1 until first counted
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __iter__(self):
+        for index in range(len(self.texts)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.texts)))]
+        start = self.starts[index]
+        end = self.ends[index]
+        return TranscriptLine(
+            self.ids[index], self.speakers[index],
+            None if math.isnan(start) else start, None if math.isnan(end) else end,
+            self.texts[index]
+        )
+
+    def __setitem__(self, index, line):
+        self.ids[index] = line.id
+        self.speakers[index] = sys.intern(line.speaker)
+        self.starts[index] = math.nan if line.start is None else line.start
+        self.ends[index] = math.nan if line.end is None else line.end
+        self.texts[index] = line.text
+        self.tokens[index] = -1
+
+    def append(self, line):
+        """Add a line at the end of the transcript."""
+        self.ids.append(line.id)
+        # Speaker names repeat on nearly every line, so share one string per name
+        self.speakers.append(sys.intern(line.speaker))
+        self.starts.append(math.nan if line.start is None else line.start)
+        self.ends.append(math.nan if line.end is None else line.end)
+        self.texts.append(line.text)
+        self.tokens.append(-1)
+
+    def line_tokens(self, index):
+        """Estimated tokens of one display line, counted once and cached until the line is revised."""
+        if self.tokens[index] < 0:
+            self.tokens[index] = estimate_tokens(self[index].display_text())
+        return self.tokens[index]
+
+    def text(self):
+        """The whole transcript as display lines, for analysis and plain-text exports."""
+        return "\n".join(line.display_text() for line in self)
+
+    def spoken_text(self):
+        """Only what was said, without timestamps or speaker names."""
+        return "\n".join(self.texts)
+
+def reconcile_records(records, transcript, seen_lines, recent_lines, prepare):
+    """Revise recent lines in place and append new ones; returns the indexes of revised lines."""
+    revised = []
+    keys = [line_identity(record) for record in records]
+    # Records in one batch are distinct lines; only lines committed by earlier batches can be revised
+    committed = list(recent_lines)
+
+    def revise(entry, record, key):
+        # Otter keeps refining its last few lines; update those in place instead of appending
+        if format_transcript_record(entry[0]) != format_transcript_record(record):
+            entry[0] = record
+            transcript[entry[1]] = prepare(TranscriptLine.from_record(record))
+            seen_lines.add(key)
+            revised.append(entry[1])
+
+    # A snapshot that still shows the newest committed lines is lined up on them: records before them are
+    # already stored, even once the identity window has forgotten them, and every record after them is new
+    anchor = align_snapshot(records, keys, committed)
+    start = 0
+    if anchor is not None:
+        for back in range(min(anchor + 1, len(committed))):
+            revise(committed[-1 - back], records[anchor - back], keys[anchor - back])
+        start = anchor + 1
+
+    appended = set()
+    for record, key in zip(records[start:], keys[start:]):
+        if anchor is None:
+            entry = match_revised_line(record, committed)
+            if entry is not None:
+                revise(entry, record, key)
+                continue
+            # Without an anchor, skip lines an earlier batch committed; identity includes speaker and
+            # timestamp so two people saying the same words are kept as two lines
+            if key in seen_lines and key not in appended:
+                continue
+        seen_lines.add(key)
+        appended.add(key)
+        transcript.append(prepare(TranscriptLine.from_record(record)))
+        recent_lines.append([record, len(transcript) - 1])
+    return revised
+
+# --------------------------
+# Transcript Sources
+# --------------------------
+# Any other text in the URL field is an Otter meeting page, which the assistant scrapes itself
+REPLAY_TARGET_PATTERN = re.compile(r"^replay:(?P<path>.+?)(?:@(?P<speed>\d+(?:\.\d+)?)x)?$", re.IGNORECASE)
+TARGET_START_PATTERN = re.compile(r"https?://|file://|replay:|[a-z]:[\\/]", re.IGNORECASE)
+TARGET_SEPARATOR_PATTERN = re.compile(r"[\s,]+")
+CUE_TIME_PATTERN = re.compile(r"(?:(\d+):)?(\d{1,2}):(\d{2})(?:[.,](\d{1,3}))?")
+SPEAKER_PREFIX_PATTERN = re.compile(r"^([^:\[\]<>]{1,40}):\s+(.+)$")
+VOICE_TAG_PATTERN = re.compile(r"<v(?:\.[\w.-]+)?\s+([^>]+)>")
+
+def parse_cue_time(value):
+    """Convert a VTT (mm:ss.mmm, hh:mm:ss.mmm) or SRT (hh:mm:ss,mmm) cue time to seconds."""
+    match = CUE_TIME_PATTERN.fullmatch(value.strip())
+    if not match:
+        return None
+    hours, minutes, seconds, fraction = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int((fraction or "0").ljust(3, "0")) / 1000.0
+
+def split_speaker(text):
+    """Split a leading "Speaker: " prefix off a line of text."""
+    match = SPEAKER_PREFIX_PATTERN.match(text)
+    if match:
+        return match.group(1).strip(), match.group(2).strip()
+    return "", text.strip()
+
+def text_line_record(line):
+    """Parse a plain-text transcript line such as "[0:01:02] Speaker: text" (the saved transcript format)."""
+    record = line_text_record(line.strip())
+    record["speaker"], record["text"] = split_speaker(record["text"])
+    return record
+
+def cue_record(cue_lines):
+    """Parse one VTT or SRT cue block, or return None for headers, notes and malformed blocks."""
+    for index, line in enumerate(cue_lines):
+        if "-->" in line:
+            break
+    else:
+        return None
+    start_text, _, end_text = line.partition("-->")
+    start = parse_cue_time(start_text)
+    # VTT cue settings (align:start etc.) follow the end time
+    end = parse_cue_time(end_text.split()[0]) if end_text.split() else None
+    text = " ".join(part.strip() for part in cue_lines[index + 1:] if part.strip())
+    if start is None or not text:
+        return None
+    voice = VOICE_TAG_PATTERN.search(text)
+    text = re.sub(r"<[^>]+>", "", text).strip()
+    if voice:
+        speaker = voice.group(1).strip()
+    else:
+        speaker, text = split_speaker(text)
+    return {"id": None, "speaker": speaker, "timestamp": format_timestamp(start), "start": start, "end": end, "text": text}
+
+class TranscriptFileParser:
+    """Incrementally parse a plain-text, VTT or SRT transcript fed in complete lines."""
+
+    def __init__(self, path):
+        self.cues = os.path.splitext(path)[1].lower() in (".vtt", ".srt")
+        self.cue_lines = []
+
+    def feed(self, lines):
+        """Parse complete lines and return the records they finish."""
+        records = []
+        for line in lines:
+            if not self.cues:
+                if line.strip():
+                    records.append(text_line_record(line))
+            elif line.strip():
+                self.cue_lines.append(line)
+            else:
+                # A blank line ends a cue; a cue still being written stays buffered until then
+                record = cue_record(self.cue_lines)
+                if record:
+                    records.append(record)
+                self.cue_lines = []
+        return records
+
+    def flush(self):
+        """Return the record for a final cue with no trailing blank line."""
+        record = cue_record(self.cue_lines)
+        self.cue_lines = []
+        return [record] if record else []
+
+class TranscriptFileSource(abc.ABC):
+    """A transcript file read directly instead of an Otter page; the assistant polls read() for new records."""
+
+    kind = "source"
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path[len("file://"):] if path.startswith("file://") else path)
+        self.title = os.path.splitext(os.path.basename(self.path))[0] or "Transcript"
+
+    @property
+    def finished(self):
+        """Whether the source will never produce more lines."""
+        return False
+
+    def describe(self):
+        """Short description for the status log."""
+        return f"{self.kind} {self.path}"
+
+    @abc.abstractmethod
+    def read(self):
+        """Return the records that became available since the last read."""
+
+class FileTailSource(TranscriptFileSource):
+    """Follow a transcript file that another recorder keeps appending to."""
+
+    kind = "file"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.offset = 0
+        self.pending = b""  # trailing bytes of a line that is still being written
+        self.parser = TranscriptFileParser(self.path)
+
+    def read(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return []  # not created yet, or being replaced
+        if size < self.offset:
+            # Truncated or replaced: start over; de-duplication drops lines already seen
+            self.offset, self.pending = 0, b""
+            self.parser = TranscriptFileParser(self.path)
+        if size == self.offset:
+            return []
+        with open(self.path, "rb") as file:
+            file.seek(self.offset)
+            data = self.pending + file.read()
+            self.offset = file.tell()
+        # Only parse complete lines, and split on bytes so a multi-byte character is never cut
+        complete = data.rfind(b"\n") + 1
+        self.pending = data[complete:]
+        return self.parser.feed(data[:complete].decode("utf-8-sig", errors="replace").splitlines())
+
+class ReplaySource(TranscriptFileSource):
+    """Play back a recorded transcript on its own timeline, sped up for load tests."""
+
+    kind = "replay"
+
+    def __init__(self, path, speed=1.0, line_gap=2.0):
+        super().__init__(path)
+        self.speed = min(max(float(speed), 1.0), 100.0)
+        with open(self.path, encoding="utf-8-sig", errors="replace") as file:
+            parser = TranscriptFileParser(self.path)
+            self.records = parser.feed(file.read().splitlines()) + parser.flush()
+        # Lines without timestamps are spaced line_gap seconds apart
+        self.offsets = []
+        previous = None
+        for record in self.records:
+            start = record.get("start")
+            if start is None:
+                start = parse_timestamp(record.get("timestamp"))
+            if start is None or (previous is not None and start < previous):
+                start = previous + line_gap if previous is not None else 0.0
+            self.offsets.append(start)
+            previous = start
+        self.origin = self.offsets[0] if self.offsets else 0.0
+        self.position = 0
+        self.started = None
+
+    @property
+    def finished(self):
+        return self.position >= len(self.records)
+
+    def describe(self):
+        return f"replay {self.path} ({len(self.records)} lines at {self.speed:g}x)"
+
+    def read(self):
+        now = time.perf_counter()
+        if self.started is None:
+            self.started = now
+        elapsed = (now - self.started) * self.speed + self.origin
+        first = self.position
+        while self.position < len(self.records) and self.offsets[self.position] <= elapsed:
+            self.position += 1
+        return self.records[first:self.position]
+
+def split_meeting_targets(text):
+    """Split the URL field into meeting URLs and transcript paths; paths may contain spaces and commas."""
+    targets = []
+    start = 0
+    text = text.strip()
+    for separator in TARGET_SEPARATOR_PATTERN.finditer(text):
+        current = text[start:separator.start()]
+        # A new target starts with a scheme or a drive letter; a URL never contains whitespace
+        if separator.end() == len(text) or TARGET_START_PATTERN.match(text, separator.end()) or (
+            "," not in separator.group() and re.fullmatch(r"https?://\S+", current, re.IGNORECASE)
+        ):
+            targets.append(current)
+            start = separator.end()
+    targets.append(text[start:])
+    return [target for target in targets if target]
+
+def open_transcript_source(target):
+    """Create the source for a local transcript target, or return None for an Otter meeting URL."""
+    match = REPLAY_TARGET_PATTERN.match(target)
+    if match:
+        return ReplaySource(match.group("path"), match.group("speed") or settings.get("replay_speed", 1.0))
+    if target.lower().startswith("file://"):
+        return FileTailSource(target[len("file://"):])
+    # Any other URL is a meeting page, even one ending in .txt; one-letter schemes are Windows drives
+    if len(urlparse(target).scheme) > 1:
+        return None
+    if os.path.splitext(target)[1].lower() in (".txt", ".vtt", ".srt"):
+        return FileTailSource(target)
+    return None
+
+# --------------------------
+# Meeting Sessions
+# --------------------------
+class MeetingSession:
+    """Capture state for one monitored meeting; sessions share the browser and event loop."""
+
+    def __init__(self, session_id, url, source=None):
+        self.session_id = session_id
+        self.url = url
+        self.source = source  # TranscriptFileSource, or None for an Otter page
+        self.active = True
+        self.context = None
+        self.page = None
+        self.transcript_box = None
+        self.timer = QTimer()
+        self.meeting_title = "Unknown Meeting"
+        self.transcript = TranscriptStore()
+        self.emitted_offset = 0
+        self.analysis = None  # AnalysisCoordinator, attached by the assistant
+        self.analysis_context = AnalysisContext(
+            settings.get("context_recent_lines", 20),
+            settings.get("context_max_recent_lines", 80),
+            settings.get("summary_chunk_lines", 200)
+        )
+        self.schedule = AnalysisSchedule(
+            settings.get("summary_line_interval", 10),
+            settings.get("summary_time_interval", 120),
+            settings.get("analysis_min_spacing", 20)
+        )
+        self.seen_lines = LineIdentityIndex(settings.get("dedup_window", DEFAULT_DEDUP_WINDOW))
+        self.recent_lines = collections.deque(maxlen=settings.get("reconcile_window", DEFAULT_RECONCILE_WINDOW))
+        self.line_blocks = []  # (first block, block count) in transcript_box per emitted line
+        self.harvesting = False
+        self.reconnecting = False
+        self.worker = None  # scraper process, when scraping runs out of process
+        self.worker_connection = None
+        self.reconnects = 0
+        self.poll_errors = 0
+        self.coverage = {"expected": 0, "captured": 0}
+        self.poll_stats = {"polls": 0, "last_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0, "interval_s": 0.0, "skipped": 0}
+        self.poll_in_flight = False
+        self.line_queue = None
+        self.push_consumer_task = None
+        self.observer_active = False
+        self.capture_source = "dom"
+        self.content_keyed = False  # lines are matched by content once capture has switched sources
+        self.network_records_at = None  # monotonic time the network last delivered lines
+        self.startup_state = None
+        self.startup_started = None
+        self.startup_timings = {}
+        self.warm_start = False
+        self.blocked_requests = 0
+        self.blocked_bytes = 0  # estimated from TYPICAL_RESOURCE_BYTES
+
+    @property
+    def label(self):
+        """Name shown on the session's tab and in log messages."""
+        if self.meeting_title != "Unknown Meeting":
+            return self.meeting_title
+        if self.source is not None:
+            return self.source.title
+        return f"Meeting {self.session_id}"
+
+# --------------------------
+# Scraper Process
+# --------------------------
+def scraper_worker_options(headless):
+    """Snapshot the settings the scraper process needs; it cannot read the GUI's settings later."""
+    state_path = settings.get("storage_state_path", DEFAULT_STORAGE_STATE_PATH)
+    return {
+        "headless": headless,
+        "storage_state": state_path if os.path.exists(state_path) else None,
+        "storage_state_path": state_path,
+        "poll_interval": settings.get("poll_interval", DEFAULT_POLL_INTERVAL),
+        "dedup_window": settings.get("dedup_window", DEFAULT_DEDUP_WINDOW),
+        "reconcile_window": settings.get("reconcile_window", DEFAULT_RECONCILE_WINDOW),
+        "spellcheck": settings.get("spellcheck_enabled", False),
+        "anonymize": settings.get("anonymize_transcript", False),
+        "startup_timeouts": {**DEFAULT_STARTUP_TIMEOUTS, **settings.get("startup_timeouts", {})},
+        "reconnect_after_errors": settings.get("reconnect_after_errors", 3),
+        "reconnect_initial_delay": settings.get("reconnect_initial_delay", 2),
+        "reconnect_max_delay": settings.get("reconnect_max_delay", 60),
+    }
+
+def make_line_preparer(options):
+    """Spell check and anonymize lines the way the GUI would, for use outside it."""
+    known_names = []
+
+    def prepare(line):
+        if options["spellcheck"]:
+            line.text = correct_spelling(line.text)
+        if options["anonymize"]:
+            line.text, name_mapping = anonymize_names(line.text, known_names)
+            known_names[:] = list(name_mapping.keys())
+            if line.speaker:
+                line.speaker, _ = anonymize_names(line.speaker, known_names)
+        return line
+    return prepare
+
+def run_scraper_worker(url, connection, options):
+    """Scraper process entry point; any message from the GUI tells it to stop."""
+    try:
+        asyncio.run(scrape_in_worker(url, connection, options))
+    except Exception as e:
+        connection.send(("status", f"Scraper process stopped: {e}"))
+    finally:
+        connection.close()
+
+async def reopen_worker_page(browser, page, url, options):
+    """Replace the scraper process's dead meeting page with a fresh one on the same meeting."""
+    try:
+        await page.context.close()
+    except Exception:
+        pass
+    state_path = options["storage_state_path"]
+    context = await browser.new_context(storage_state=state_path if os.path.exists(state_path) else None)
+    timeouts = options["startup_timeouts"]
+    try:
+        page = await context.new_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeouts["navigate"] * 1000)
+        await page.wait_for_selector(TRANSCRIPT_CONTAINER_SELECTOR, timeout=timeouts["transcript"] * 1000)
+    except Exception:
+        await context.close()
+        raise
+    return page
+
+async def scrape_in_worker(url, connection, options):
+    """Open the meeting, poll and reconcile lines, and stream compact line tuples to the GUI."""
+    transcript = TranscriptStore()
+    seen_lines = LineIdentityIndex(options["dedup_window"])
+    recent_lines = collections.deque(maxlen=options["reconcile_window"])
+    prepare = make_line_preparer(options)
+    timeouts = options["startup_timeouts"]
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=options["headless"])
+        context = await browser.new_context(storage_state=options["storage_state"])
+        page = await context.new_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeouts["navigate"] * 1000)
+        try:
+            await page.wait_for_selector(
+                f"{TRANSCRIPT_CONTAINER_SELECTOR}, {LOGIN_FORM_SELECTOR}", timeout=timeouts["render"] * 1000
+            )
+        except Exception as e:
+            print(f"[DEBUG] Scraper process page did not render: {e}")
+        # Nobody can sign in to a hidden window; the GUI restarts this process headed
+        if options["headless"] and await page.query_selector(LOGIN_FORM_SELECTOR):
+            connection.send(("login_required",))
+            await browser.close()
+            return
+        try:
+            # Covers a sign-in in the visible window as well as the transcript rendering
+            await page.wait_for_selector(
+                TRANSCRIPT_CONTAINER_SELECTOR, timeout=(timeouts["login"] + timeouts["transcript"]) * 1000
+            )
+            # Persist the login so the next run can start headless
+            await context.storage_state(path=options["storage_state_path"])
+        except Exception as e:
+            connection.send(("status", f"Transcript not found yet, continuing: {e}"))
+        connection.send(("status", "Scraper process attached to the meeting"))
+
+        emitted = 0
+        title_sent = False
+        poll_errors = 0
+        delay = options["reconnect_initial_delay"]
+        while not connection.poll():
+            try:
+                if not title_sent:
+                    title_element = await page.query_selector("h1.title")
+                    if title_element:
+                        title = (await title_element.inner_text()).strip()
+                        if title:
+                            connection.send(("title", title))
+                            title_sent = True
+
+                records = await extract_transcript_records(page)
+                for index in reconcile_records(records, transcript, seen_lines, recent_lines, prepare):
+                    if index < emitted:
+                        connection.send(("revise", index, transcript[index].fields()))
+                if len(transcript) > emitted:
+                    connection.send(("lines", [line.fields() for line in transcript[emitted:]]))
+                    emitted = len(transcript)
+                poll_errors = 0
+            except Exception as e:
+                poll_errors += 1
+                print(f"[DEBUG] Scraper process poll failed ({poll_errors} in a row): {e}")
+            # The same rule as the GUI's reconnect: reopen the page, keeping the lines already sent
+            if poll_errors >= options["reconnect_after_errors"]:
+                if not browser.is_connected():
+                    connection.send(("status", "Scraper process browser closed; capture stopped"))
+                    return
+                connection.send(("status", "Transcript page stopped responding. Reopening..."))
+                try:
+                    page = await reopen_worker_page(browser, page, url, options)
+                except Exception as e:
+                    # Another poll fails on the old page and retries the reopen after the backoff
+                    print(f"[DEBUG] Scraper process could not reopen the page: {e}")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, options["reconnect_max_delay"])
+                    continue
+                poll_errors = 0
+                delay = options["reconnect_initial_delay"]
+                connection.send(("status", f"Reconnected; resuming after line {len(transcript)}"))
+            await asyncio.sleep(options["poll_interval"])
+        await browser.close()
+
+class FrameLatencyProbe:
+    """Measures how late a 16 ms GUI timer fires, a proxy for UI frame latency."""
+
+    def __init__(self, interval_ms=16, max_samples=4000):
+        self.interval_ms = interval_ms
+        self.lateness_ms = collections.deque(maxlen=max_samples)
+        self.last_tick = None
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+    def start(self):
+        self.lateness_ms.clear()
+        self.last_tick = time.perf_counter()
+        self.timer.start(self.interval_ms)
+
+    def tick(self):
+        now = time.perf_counter()
+        self.lateness_ms.append(max(0.0, (now - self.last_tick) * 1000 - self.interval_ms))
+        self.last_tick = now
+
+    def stop(self):
+        """Stop sampling and return the latency summary."""
+        self.timer.stop()
+        return self.summary()
+
+    def summary(self):
+        """Average, 95th percentile and worst lateness in ms."""
+        samples = sorted(self.lateness_ms)
+        if not samples:
+            return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            "avg_ms": sum(samples) / len(samples),
+            "p95_ms": samples[int(len(samples) * 0.95)],
+            "max_ms": samples[-1],
+        }
+
+# --------------------------
+# AI Analysis
+# --------------------------
+def create_groq_client(base_url=None, api_key=None):
+    """Async Groq client whose requests time out instead of holding analysis open indefinitely."""
+    return groq.AsyncGroq(
+        api_key=api_key,
+        base_url=base_url or settings.get("groq_base_url") or None,
+        timeout=settings.get("analysis_timeout", DEFAULT_ANALYSIS_TIMEOUT),
+        max_retries=settings.get("analysis_max_retries", 1),
+    )
+
+ANALYSIS_SECTIONS = ("SUGGESTED RESPONSE", "KEY INSIGHTS", "TOPIC SUMMARY")
+ANALYSIS_SECTION_COLORS = {"SUGGESTED RESPONSE": "#007AFF", "KEY INSIGHTS": "#FF9500", "TOPIC SUMMARY": "#5AC8FA"}
+FANOUT_SECTION_COLOR = "#AF52DE"  # header of a fan-out prompt's answer in the insights panel
+
+class SectionRouter:
+    """Route streamed analysis text to its sections as it arrives, holding back only a possibly split header."""
+
+    def __init__(self):
+        self.section = None
+        self.pending = ""
+        self.preamble = []  # text before the first header, shown only if no header ever arrives
+        self.section_start = False
+
+    def feed(self, text):
+        """Return (section, text) events for the routable text; (section, None) opens a section."""
+        self.pending += text
+        events = []
+        while True:
+            headers = [(self.pending.find(f"{name}:"), name) for name in ANALYSIS_SECTIONS if f"{name}:" in self.pending]
+            if not headers:
+                break
+            index, name = min(headers)
+            # Markdown emphasis around a header ("**KEY INSIGHTS:**") is dropped with it
+            self.route(self.pending[:index].rstrip(" *#"), events)
+            events.append((name, None))
+            self.section = name
+            self.section_start = True
+            self.pending = self.pending[index + len(name) + 1:]
+        # Hold back what could be the start of a header split across chunks, with any emphasis before it
+        hold = max(
+            (size for name in ANALYSIS_SECTIONS for size in range(1, len(name) + 1)
+             if self.pending.endswith(name[:size])),
+            default=0
+        )
+        cut = len(self.pending[:len(self.pending) - hold].rstrip(" *#"))
+        self.route(self.pending[:cut], events)
+        self.pending = self.pending[cut:]
+        return events
+
+    def finish(self):
+        """Flush held-back text; unstructured output comes back as a single (None, text) event."""
+        events = []
+        self.route(self.pending, events)
+        self.pending = ""
+        if self.section is None and "".join(self.preamble).strip():
+            events.append((None, "".join(self.preamble).strip()))
+        return events
+
+    def route(self, text, events):
+        """Add text to the current section, dropping the blank space right after a header."""
+        if self.section_start:
+            text = text.lstrip(" \t*\r\n")
+            if not text:
+                return
+            self.section_start = False
+        if not text:
+            return
+        if self.section is None:
+            self.preamble.append(text)
+        else:
+            events.append((self.section, text))
+
+SUMMARY_SYSTEM_PROMPT = "You maintain a concise running summary of a meeting for an assistant that is analyzing it live."
+
+ANALYSIS_SYSTEM_PROMPT = "You are an intelligent meeting assistant."
+MESSAGE_OVERHEAD_TOKENS = 16  # chat template tokens around the system and user messages
+TOKEN_PIECE_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+def estimate_tokens(text):
+    """Approximate Llama-style token count: one per word or symbol, plus one per extra 6 characters of a long word."""
+    return sum(1 + (len(piece) - 1) // 6 for piece in TOKEN_PIECE_PATTERN.findall(text))
+
+def context_window(model):
+    """Context window of a model in tokens."""
+    windows = {**MODEL_CONTEXT_WINDOWS, **settings.get("model_context_windows", {})}
+    if model in windows:
+        return windows[model]
+    suffix = re.search(r"-(\d{4,6})$", model)
+    return int(suffix.group(1)) if suffix else DEFAULT_CONTEXT_WINDOW
+
+def prompt_budget(model, instructions, max_tokens=DEFAULT_ANALYSIS_MAX_TOKENS):
+    """Tokens left for transcript context once the completion, instructions and a safety margin are reserved."""
+    window = context_window(model)
+    # The estimate is approximate, so keep a margin for tokenizer differences
+    usable = int(window * (1 - settings.get("token_safety_margin", 0.1)))
+    return usable - max_tokens - estimate_tokens(instructions) - estimate_tokens(ANALYSIS_SYSTEM_PROMPT) - MESSAGE_OVERHEAD_TOKENS
+
+def fit_transcript_lines(transcript, budget, start=0):
+    """Walk back from the newest line; return the oldest index (not before start) that fits and the tokens used."""
+    used = 0
+    first = len(transcript)
+    while first > start:
+        cost = transcript.line_tokens(first - 1) + 1  # and its newline
+        if used + cost > budget:
+            break
+        used += cost
+        first -= 1
+    return first, used
+
+def trim_to_tokens(text, budget):
+    """Keep the end of text within budget tokens, dropping its oldest words."""
+    words = text.split(" ")
+    kept = []
+    used = 0
+    for word in reversed(words):
+        used += estimate_tokens(word)
+        if used > budget:
+            break
+        kept.append(word)
+    return " ".join(reversed(kept))
+
+def assemble_transcript_context(transcript, budget=math.inf, summary="", start=0, heading="Recent transcript:"):
+    """Transcript context within budget tokens, filled newest first; returns it with the number of lines left out."""
+    budget -= estimate_tokens(heading) + 2
+    first, used = fit_transcript_lines(transcript, budget, start)
+    parts = []
+    remaining = budget - used - estimate_tokens("Meeting summary so far:") - 2
+    # The summary covers the oldest part of the meeting, so it only gets what the newest lines leave
+    if summary and remaining > 0:
+        parts.append(f"Meeting summary so far:\n{summary if remaining == math.inf else trim_to_tokens(summary, remaining)}")
+    parts.append(heading + "\n" + "\n".join(line.display_text() for line in transcript[first:]))
+    return "\n\n".join(parts), first - start
+
+def summary_prompt(summary, lines_text, max_words):
+    """Prompt asking the model to fold new transcript lines into the running summary."""
+    return (
+        f"Running summary so far:\n{summary or '(none yet)'}\n\n"
+        f"New transcript lines:\n{lines_text}\n\n"
+        f"Rewrite the running summary so it also covers the new lines. Keep topics, decisions, open questions, "
+        f"action items and who said what. Use at most {max_words} words and reply with the summary only."
+    )
+
+class AnalysisContext:
+    """Rolling analysis context: a running summary of older lines plus the recent lines verbatim."""
+
+    def __init__(self, min_recent=20, max_recent=80, chunk_lines=200):
+        self.min_recent = min_recent
+        self.max_recent = max_recent
+        self.chunk_lines = chunk_lines
+        self.summary = ""
+        self.summarized = 0  # lines before this index are covered by the summary
+        self.analyzed = 0  # line count at the last completed analysis
+        self.analyzed_start = 0  # first verbatim line of the last completed analysis
+
+    def recent_start(self, line_count):
+        """First line sent verbatim: the lines since the last analysis, within min_recent..max_recent."""
+        # Nothing new since the last analysis: send the same context, so an identical request hits the cache
+        if line_count == self.analyzed:
+            return self.analyzed_start
+        start = min(self.analyzed, line_count - self.min_recent)
+        return max(0, start, line_count - self.max_recent)
+
+    def analysis_done(self, line_count):
+        """Record a completed analysis of the first line_count lines."""
+        self.analyzed_start = self.recent_start(line_count)
+        self.analyzed = line_count
+
+    async def compact(self, transcript, summarize, budget=math.inf):
+        """Fold the lines older than the recent window into the summary with summarize(summary, text)."""
+        end = self.recent_start(len(transcript))
+        while self.summarized < end:
+            # Each summary request takes up to chunk_lines lines, and no more than budget tokens of them
+            chunk_end = self.summarized + 1
+            used = transcript.line_tokens(self.summarized)
+            while (chunk_end < min(end, self.summarized + self.chunk_lines)
+                   and used + transcript.line_tokens(chunk_end) <= budget):
+                used += transcript.line_tokens(chunk_end)
+                chunk_end += 1
+            text = "\n".join(line.display_text() for line in transcript[self.summarized:chunk_end])
+            self.summary = (await summarize(self.summary, text)).strip()
+            self.summarized = chunk_end
+
+    def build(self, transcript, budget=math.inf):
+        """The context to send, the running summary then the recent lines, with the number of lines left out."""
+        return assemble_transcript_context(transcript, budget, self.summary, self.recent_start(len(transcript)))
+
+def request_digest(request):
+    """Content address of a completion request: the model, messages and sampling parameters."""
+    return hashlib.blake2b(json.dumps(request, sort_keys=True).encode("utf-8"), digest_size=16).hexdigest()
+
+class ResponseCache:
+    """LRU cache of analysis responses keyed by request digest, with an optional size-capped disk tier."""
+
+    def __init__(self, max_entries=64, disk_path=None, disk_max_bytes=0):
+        self.entries = collections.OrderedDict()
+        self.max_entries = max_entries
+        self.disk_path = disk_path if disk_path and disk_max_bytes > 0 else None
+        self.disk_max_bytes = disk_max_bytes
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0}
+
+    def get(self, key):
+        """Return the cached response for a digest, or None."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return self.entries[key]
+        if self.disk_path:
+            path = os.path.join(self.disk_path, f"{key}.txt")
+            try:
+                with open(path, encoding="utf-8") as file:
+                    response = file.read()
+                # Eviction goes by modification time, so a read marks the file as recently used
+                os.utime(path)
+            except OSError:
+                pass
+            else:
+                self.stats["disk_hits"] += 1
+                self.remember(key, response)
+                return response
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key, response):
+        """Cache a response in memory and, when enabled, on disk."""
+        self.remember(key, response)
+        if not self.disk_path:
+            return
+        try:
+            os.makedirs(self.disk_path, exist_ok=True)
+            with open(os.path.join(self.disk_path, f"{key}.txt"), "w", encoding="utf-8") as file:
+                file.write(response)
+            self.evict_disk()
+        except OSError as e:
+            print(f"[DEBUG] response cache write failed: {e}")
+
+    def remember(self, key, response):
+        """Add a response to the memory tier, dropping the least recently used past max_entries."""
+        self.entries[key] = response
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def evict_disk(self):
+        """Delete the least recently used cache files until the disk tier is within its size limit."""
+        files = []
+        for entry in os.scandir(self.disk_path):
+            if entry.name.endswith(".txt"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def summary(self):
+        """Hit and miss counts for the status log."""
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        return (f"{hits} hits ({self.stats['disk_hits']} from disk), {self.stats['misses']} misses, "
+                f"{self.stats['bypassed']} bypassed")
+
+class AnalysisSchedule:
+    """Decides when a meeting is due for analysis from new lines and elapsed time, keeping a minimum spacing."""
+
+    def __init__(self, line_interval=10, time_interval=120, min_spacing=20, now=None):
+        self.line_interval = line_interval  # 0 disables the line trigger
+        self.time_interval = time_interval  # seconds; 0 disables the time trigger
+        self.min_spacing = min_spacing  # seconds between analyses from any trigger
+        self.last_run = None  # the first analysis is not held back by min_spacing
+        self.interval_start = time.monotonic() if now is None else now
+        self.new_lines = 0
+        self.deferred = False
+
+    def add_lines(self, count):
+        """Count lines added since the last analysis."""
+        self.new_lines += count
+
+    def check(self, now):
+        """Return (trigger, reason): the trigger name when an analysis is due, and the decision worth logging."""
+        since_run = math.inf if self.last_run is None else now - self.last_run
+        if self.line_interval and self.new_lines >= self.line_interval:
+            trigger, why = "line interval", f"{self.new_lines} new lines"
+        elif self.time_interval and now - self.interval_start >= self.time_interval:
+            if not self.new_lines:
+                # Nothing was said, so there is nothing new to analyze; wait out another interval
+                self.interval_start = now
+                return None, f"skipped {self.time_interval}s interval with no new lines"
+            trigger, why = "time interval", f"{self.new_lines} new lines in {now - self.interval_start:.0f}s"
+        else:
+            return None, None
+        if since_run < self.min_spacing:
+            reason = None if self.deferred else (
+                f"deferred {trigger} ({why}): {since_run:.0f}s since the last analysis, minimum {self.min_spacing}s"
+            )
+            self.deferred = True
+            return None, reason
+        if self.last_run is None:
+            return trigger, f"{trigger} due ({why}, first analysis)"
+        return trigger, f"{trigger} due ({why}, {since_run:.0f}s since the last analysis)"
+
+    def ran(self, now):
+        """Restart both intervals when any analysis starts, scheduled or not."""
+        self.last_run = now
+        self.interval_start = now
+        self.new_lines = 0
+        self.deferred = False
+
+ANALYSIS_OUTCOMES = ("requested", "run", "merged", "skipped", "cancelled")
+
+class AnalysisCoordinator:
+    """Single-flight analysis for one meeting: triggers during a run merge into one follow-up, stale runs are cancelled."""
+
+    def __init__(self, run, line_count, stale_after_lines=20):
+        self.run = run  # coroutine function taking the trigger that started the request and whether to skip the cache
+        self.line_count = line_count  # current transcript length
+        self.stale_after_lines = stale_after_lines
+        self.task = None
+        self.task_triggers = []
+        self.task_bypass = False
+        self.task_output = False  # whether the running request has started writing into the panels
+        self.task_lines = 0  # transcript length when the running request started
+        self.follow_up = []  # triggers waiting for the running request to finish
+        self.follow_up_bypass = False  # whether any of them asked to skip the response cache
+        self.counts = {}  # trigger -> count per ANALYSIS_OUTCOMES entry
+
+    def count(self, trigger, outcome):
+        counts = self.counts.setdefault(trigger, dict.fromkeys(ANALYSIS_OUTCOMES, 0))
+        counts[outcome] += 1
+
+    def request(self, trigger, bypass_cache=False):
+        """Run, queue or restart analysis for a trigger; returns which of those happened."""
+        self.count(trigger, "requested")
+        if self.task is None or self.task.done():
+            self.start([trigger], bypass_cache)
+            return "started"
+        self.follow_up.append(trigger)
+        self.follow_up_bypass = self.follow_up_bypass or bypass_cache
+        if self.stale():
+            self.restart([])
+            return "restarted"
+        return "queued"
+
+    def lines_committed(self):
+        """Restart the running request if the lines committed since it started make it stale; returns whether it did."""
+        if self.task is None or self.task.done() or not self.stale():
+            return False
+        self.restart([self.task_triggers[0]])
+        return True
+
+    def output_started(self):
+        """Mark the running request as streaming into the panels; from then on it runs to the end."""
+        self.task_output = True
+
+    def stale(self):
+        """Whether enough new lines have arrived that the running answer would be out of date before it lands."""
+        # Cancelling an answer part way through its stream would leave half of it above the restarted one
+        if self.task_output:
+            return False
+        return self.line_count() - self.task_lines >= self.stale_after_lines
+
+    def restart(self, triggers):
+        """Cancel the running request and start one for triggers plus the follow-up on the newest lines."""
+        self.count(self.task_triggers[0], "cancelled")
+        self.task.cancel()
+        bypass_cache = self.task_bypass or self.follow_up_bypass
+        triggers, self.follow_up, self.follow_up_bypass = triggers + self.follow_up, [], False
+        self.start(triggers, bypass_cache)
+
+    def start(self, triggers, bypass_cache=False):
+        """Start one request on behalf of every trigger in triggers."""
+        self.count(triggers[0], "run")
+        for trigger in triggers[1:]:
+            self.count(trigger, "merged")
+        self.task_triggers = triggers
+        self.task_bypass = bypass_cache
+        self.task_output = False
+        self.task_lines = self.line_count()
+        self.task = asyncio.ensure_future(self.run(triggers[0], bypass_cache))
+        self.task.add_done_callback(self.finished)
+
+    def finished(self, task):
+        """Run the merged follow-up, unless nothing changed since the request that just finished."""
+        if task is not self.task or not self.follow_up:
+            return
+        triggers, self.follow_up = self.follow_up, []
+        bypass_cache, self.follow_up_bypass = self.follow_up_bypass, False
+        if self.line_count() == self.task_lines and not bypass_cache:
+            for trigger in triggers:
+                self.count(trigger, "skipped")
+            return
+        self.start(triggers, bypass_cache)
+
+    def cancel(self):
+        """Drop the follow-up and cancel the running request."""
+        self.follow_up = []
+        self.follow_up_bypass = False
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+    def summary(self):
+        """Per-trigger counts of requests made and calls saved by merging or skipping."""
+        if not self.counts:
+            return "no analysis triggered"
+        parts = [
+            f"{trigger} {counts['requested']} triggered/{counts['merged'] + counts['skipped']} saved"
+            for trigger, counts in self.counts.items()
+        ]
+        runs = sum(counts["run"] for counts in self.counts.values())
+        cancelled = sum(counts["cancelled"] for counts in self.counts.values())
+        return f"{runs} requests, {cancelled} cancelled as stale; " + ", ".join(parts)
+
 # --------------------------
 # Word Cloud Generator
 # --------------------------
@@ -559,16 +2087,20 @@ def generate_wordcloud(text):
         # Signal Bridge for Thread-Safe UI Updates
         # --------------------------
         class SignalBridge(QObject):
-            append_transcript = pyqtSignal(str)
+            append_transcript = pyqtSignal(object, object)  # session, TranscriptLine
+            revise_transcript = pyqtSignal(object, int, object)  # session, line index, revised TranscriptLine
+            worker_message = pyqtSignal(object, object)  # session, message from its scraper process
             append_suggested_response = pyqtSignal(str)
             append_insights = pyqtSignal(str)
+            stream_analysis = pyqtSignal(object, object)  # section, streamed text (None opens the section)
+            analysis_requested = pyqtSignal(str)  # trigger name, from any thread
             update_status = pyqtSignal(str)
             update_progress = pyqtSignal(int)
             highlight_transcript = pyqtSignal(str, str)  # text, color
             update_wordcloud = pyqtSignal(str)
             update_meeting_timer = pyqtSignal(str)
             detected_key_phrases = pyqtSignal(list)
-            detected_meeting_title = pyqtSignal(str)
+            detected_meeting_title = pyqtSignal(object, str)  # session, title
         
         # --------------------------
         # Custom Text Highlighter
@@ -618,6 +2150,19 @@ def generate_wordcloud(text):
                 """Clear all highlights."""
                 self.highlighter.clear_highlight_patterns()
         
+            def char_format(self, format_specs):
+                """Build a character format from format specs."""
+                text_format = QTextCharFormat()
+                if "font_size" in format_specs:
+                    text_format.setFontPointSize(format_specs["font_size"])
+                if "bold" in format_specs and format_specs["bold"]:
+                    text_format.setFontWeight(QFont.Bold)
+                if "color" in format_specs:
+                    text_format.setForeground(QBrush(QColor(format_specs["color"])))
+                if "font_family" in format_specs:
+                    text_format.setFontFamily(format_specs["font_family"])
+                return text_format
+        
             def append_formatted(self, text, format_specs=None):
                 """Append text with custom formatting."""
                 cursor = self.textCursor()
@@ -625,17 +2170,7 @@ def generate_wordcloud(text):
         
                 if format_specs:
                     # Apply specified formatting
-                    text_format = QTextCharFormat()
-                    if "font_size" in format_specs:
-                        text_format.setFontPointSize(format_specs["font_size"])
-                    if "bold" in format_specs and format_specs["bold"]:
-                        text_format.setFontWeight(QFont.Bold)
-                    if "color" in format_specs:
-                        text_format.setForeground(QBrush(QColor(format_specs["color"])))
-                    if "font_family" in format_specs:
-                        text_format.setFontFamily(format_specs["font_family"])
-        
-                    cursor.insertText(text, text_format)
+                    cursor.insertText(text, self.char_format(format_specs))
                 else:
                     # Default formatting
                     cursor.insertText(text)
@@ -647,6 +2182,31 @@ def generate_wordcloud(text):
                 self.setTextCursor(cursor)
                 self.ensureCursorVisible()
         
+            def append_streamed(self, text, format_specs=None):
+                """Append streamed text at the end of the current line."""
+                cursor = self.textCursor()
+                cursor.movePosition(cursor.End)
+                cursor.insertText(text, self.char_format(format_specs or {}))
+                self.setTextCursor(cursor)
+                self.ensureCursorVisible()
+        
+            def end_streamed(self):
+                """Start a new line after streamed text unless the last line is already empty."""
+                if self.document().lastBlock().length() > 1:
+                    self.append_formatted("")
+        
+            def replace_formatted(self, block_number, text, format_specs=None):
+                """Replace one block's text in place without touching the rest of the document."""
+                block = self.document().findBlockByNumber(block_number)
+                if not block.isValid():
+                    return
+                cursor = QTextCursor(block)
+                cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+                if format_specs:
+                    cursor.insertText(text, self.char_format(format_specs))
+                else:
+                    cursor.insertText(text)
+        
         # --------------------------
         # WordCloud Window
         # --------------------------
@@ -2146,10 +3706,12 @@ def generate_wordcloud(text):
                 
                     # Initialize state variables
                     self.running = False
-                    self.browser = None
-                    self.page = None
-                    self.buffer = []
-                    self.seen_lines = set()
+                    self.playwright = None
+                    self.browsers = {}  # headless flag -> shared browser
+                    self.browser_lock = asyncio.Lock()
+                    self.sessions = []
+                    self.active_session = None
+                    self.next_session_id = 1
                     self.summaries = []
                     self.suggested_responses = []
                     self.insights = []
@@ -2165,9 +3727,18 @@ def generate_wordcloud(text):
                     self.settings_dialog = None  # Create on demand
                 
                     # Create timers
-                    self.timer = QTimer()  # Main timer
                     self.elapsed_seconds = 0
                     self.progress_timer = QTimer()  # For AI progress indication
+                    self.frame_probe = FrameLatencyProbe()  # GUI responsiveness while monitoring, when measure_ui_latency is on
+                    self.schedule_timer = QTimer()  # time-based analysis checks
+                    self.schedule_timer.timeout.connect(self.check_analysis_schedule)
+                    self.groq_client = None  # created on first analysis so a missing API key only affects analysis
+                    self.analysis_stats = {}  # prompt name -> latency totals
+                    self.response_cache = ResponseCache(
+                        settings.get("response_cache_entries", 64),
+                        settings.get("response_cache_path", DEFAULT_RESPONSE_CACHE_PATH),
+                        int(settings.get("response_cache_disk_mb", 0) * 1024 * 1024)
+                    )
                     self.meeting_timer = QTimer()  # For meeting duration tracking
                 
                     # Create signal bridge for thread-safe UI updates
@@ -2178,8 +3749,12 @@ def generate_wordcloud(text):
                 
                     # Connect signals for UI updates
                     self.signals.append_transcript.connect(self.append_transcript)
+                    self.signals.revise_transcript.connect(self.revise_transcript)
+                    self.signals.worker_message.connect(self.on_worker_message)
                     self.signals.append_suggested_response.connect(self.append_suggested_response)
                     self.signals.append_insights.connect(self.append_insights)
+                    self.signals.stream_analysis.connect(self.render_analysis_stream)
+                    self.signals.analysis_requested.connect(self.request_analysis)
                     self.signals.update_status.connect(self.update_status)
                     self.signals.update_progress.connect(self.update_progress)
                     self.signals.highlight_transcript.connect(self.highlight_transcript)
@@ -2193,13 +3768,17 @@ def generate_wordcloud(text):
                     self.setup_tray()
                     self.setup_hotkey()
                 
+                    # Warm up Playwright and the browser in the background so Start only opens a page
+                    if self.prelaunch_wanted():
+                        QTimer.singleShot(0, lambda: asyncio.create_task(self.prelaunch_browser()))
+                
                     # Start background if configured
                     if settings.get("start_in_background", False):
                         self.hide()
             def build_ui(self):
                     # Top bar with URL input, generate button and settings
                     self.url_input = QLineEdit()
-                    self.url_input.setPlaceholderText("Enter Otter.ai meeting URL")
+                    self.url_input.setPlaceholderText("Enter Otter.ai meeting URL or transcript file (separate several with spaces or commas)")
                     self.url_input.setMinimumHeight(32)
                 
                     # Load icons
@@ -2680,25 +4259,18 @@ def generate_wordcloud(text):
             search_layout.addWidget(self.search_btn)
                 
             transcript_header_layout.addWidget(search_container)
-            # Transcript box with modern styling
-            self.transcript_box = CustomTextEdit()
-            self.transcript_box.setReadOnly(True)
-            self.transcript_box.document().setDefaultFont(
-                QFont(settings.get("font_family", "SF Pro Text"), 
-                    settings.get("font_size", DEFAULT_FONT_SIZE))
-            )
-            self.transcript_box.setStyleSheet("""
-                QTextEdit {
-                    border: none;
-                    border-bottom-left-radius: 8px;
-                    border-bottom-right-radius: 8px;
-                    background-color: transparent;
-                    padding: 12px;
-                }
-            """)
+            # One transcript tab per monitored meeting; the tab bar only appears with two or more
+            self.transcript_tabs = QTabWidget()
+            self.transcript_tabs.setTabBarAutoHide(True)
+            self.transcript_tabs.setTabsClosable(True)
+            self.transcript_tabs.setDocumentMode(True)
+            self.transcript_tabs.currentChanged.connect(self.switch_session)
+            self.transcript_tabs.tabCloseRequested.connect(self.close_session_tab)
+            self.transcript_box = self.create_transcript_box()
+            self.transcript_tabs.addTab(self.transcript_box, "Transcript")
                 
             transcript_layout.addWidget(transcript_header)
-            transcript_layout.addWidget(self.transcript_box)
+            transcript_layout.addWidget(self.transcript_tabs)
                 
             # Add panels to content layout
             content_layout.addWidget(meeting_header)
@@ -2766,7 +4338,8 @@ def generate_wordcloud(text):
                 
                 # Apply font to text boxes
                 font = QFont(font_family, font_size)
-                for text_edit in [self.transcript_box, self.suggested_response_box, self.insights_box]:
+                transcript_boxes = [self.transcript_tabs.widget(i) for i in range(self.transcript_tabs.count())]
+                for text_edit in [*transcript_boxes, self.suggested_response_box, self.insights_box]:
                     text_edit.document().setDefaultFont(font)
                 
                     # Set line and word spacing
@@ -2820,9 +4393,14 @@ def generate_wordcloud(text):
                 quit_action = QAction("Quit", self)
                 quit_action.triggered.connect(self.close)
                 
+                forget_login_action = QAction("Sign In Again on Next Start", self)
+                forget_login_action.triggered.connect(self.forget_saved_login)
+                
                 tray_menu.addAction(show_action)
                 tray_menu.addAction(hide_action)
                 tray_menu.addSeparator()
+                tray_menu.addAction(forget_login_action)
+                tray_menu.addSeparator()
                 tray_menu.addAction(quit_action)
                 
                 self.tray_icon.setContextMenu(tray_menu)
@@ -2834,7 +4412,7 @@ def generate_wordcloud(text):
                 try:
                     keyboard.add_hotkey(
                         settings.get("keyboard_shortcut", "ctrl+i"), 
-                        self.on_demand_analysis, 
+                        lambda: self.signals.analysis_requested.emit("hotkey"), 
                         suppress=False
                     )
                 except Exception as e:
@@ -2875,7 +4453,7 @@ def generate_wordcloud(text):
                         keyboard.remove_all_hotkeys()
                         keyboard.add_hotkey(
                             settings.get("keyboard_shortcut", "ctrl+i"), 
-                            self.on_demand_analysis, 
+                            lambda: self.signals.analysis_requested.emit("hotkey"), 
                             suppress=False
                         )
                     except Exception as e:
@@ -2907,16 +4485,29 @@ def generate_wordcloud(text):
             @asyncSlot()
             async def start(self):
                 """Start the transcript monitoring."""
-                if self.running:
-                    self.log("Already running")
+                # Several meetings can be monitored at once; separate their URLs with spaces or commas
+                urls = split_meeting_targets(self.url_input.text())
+                if not urls:
+                    QMessageBox.warning(self, "Error", "Please enter a valid Otter.ai URL or transcript file")
                     return
                 
-                url = self.url_input.text().strip()
-                if not url:
-                    QMessageBox.warning(self, "Error", "Please enter a valid Otter.ai URL")
-                    return
+                if self.running:
+                    open_urls = {session.url for session in self.sessions if session.active}
+                    urls = [url for url in urls if url not in open_urls]
+                    if not urls:
+                        self.log("Already running")
+                        return
                 
-                if not url.startswith("https://otter.ai/"):
+                # Transcript files and replays are read directly; everything else is an Otter page
+                sources = {}
+                for url in urls:
+                    try:
+                        sources[url] = open_transcript_source(url)
+                    except OSError as e:
+                        QMessageBox.warning(self, "Error", f"Cannot open {url}: {e}")
+                        return
+                
+                if not all(url.startswith("https://otter.ai/") for url in urls if sources[url] is None):
                     confirm = QMessageBox.question(
                         self, "URL Verification", 
                         "The URL doesn't appear to be from Otter.ai. Continue anyway?",
@@ -2926,40 +4517,48 @@ def generate_wordcloud(text):
                     if confirm == QMessageBox.No:
                         return
                 
-                # Reset state
-                self.running = True
-                self.buffer = []
-                self.seen_lines = set()
-                self.summaries = []
-                self.suggested_responses = []
-                self.insights = []
-                self.key_phrases = []
-                
-                # Clear text boxes
-                self.transcript_box.clear()
-                self.suggested_response_box.clear() 
-                self.insights_box.clear()
-                
-                # Update UI
-                self.start_btn.setEnabled(False)
-                self.stop_btn.setEnabled(True)
-                self.log("Starting transcript monitoring...")
-                self.progress_bar.setVisible(True)
-                self.update_progress(10)
-                
-                # Start meeting timer if enabled
-                if settings.get("meeting_timer_enabled", True):
-                    self.meeting_start_time = datetime.datetime.now()
-                    self.last_reminder_time = self.meeting_start_time
-                    self.meeting_timer.timeout.connect(self.update_meeting_time)
-                    self.meeting_timer.start(1000)  # Update every second
+                if not self.running:
+                    # Reset state
+                    self.running = True
+                    self.summaries = []
+                    self.suggested_responses = []
+                    self.insights = []
+                    self.key_phrases = []
                 
-                # Start in a separate thread
-                try:
-                    await self.scrape_otter(url)
-                except Exception as e:
-                    self.log(f"Error: {e}")
-                    self.stop()
+                    # Clear text boxes; transcripts from the last run are dropped with their tabs
+                    self.sessions = []
+                    self.active_session = None
+                    self.transcript_tabs.clear()
+                    self.suggested_response_box.clear() 
+                    self.insights_box.clear()
+                
+                    # Update UI; Start stays enabled so more meetings can be added while running
+                    self.start_btn.setText("Add Meeting")
+                    self.start_btn.setToolTip("Start monitoring the meetings in the URL field alongside the open ones")
+                    self.stop_btn.setEnabled(True)
+                    self.log("Starting transcript monitoring...")
+                    self.progress_bar.setVisible(True)
+                    self.update_progress(10)
+                
+                    if settings.get("measure_ui_latency", False):
+                        self.frame_probe.start()
+                    self.schedule_timer.start(ANALYSIS_SCHEDULE_CHECK_MS)
+                
+                    # Start meeting timer if enabled
+                    if settings.get("meeting_timer_enabled", True):
+                        self.meeting_start_time = datetime.datetime.now()
+                        self.last_reminder_time = self.meeting_start_time
+                        self.meeting_timer.timeout.connect(self.update_meeting_time)
+                        self.meeting_timer.start(1000)  # Update every second
+                else:
+                    self.log(f"Adding {len(urls)} meeting(s)...")
+                
+                # Every meeting shares the browser and event loop but keeps its own page and state
+                new_sessions = [self.add_session(url, sources[url]) for url in urls]
+                await asyncio.gather(*(
+                    self.scrape_otter(session) if session.source is None else self.follow_source(session)
+                    for session in new_sessions
+                ))
             @asyncSlot()
             async def stop(self):
                 """Stop transcript monitoring."""
@@ -2969,29 +4568,33 @@ def generate_wordcloud(text):
                 self.running = False
                 self.log("Stopping transcript monitoring...")
                 
-                # Close browser
-                if self.browser:
-                    try:
-                        await self.browser.close()
-                        self.browser = None
-                        self.page = None
-                    except Exception as e:
-                        print(f"Error closing browser: {e}")
+                # Stop every meeting, then close the shared browsers; a warm one stays up for the next start
+                for session in self.sessions:
+                    await self.stop_session(session)
+                prelaunch = self.prelaunch_wanted()
+                await self.close_browser(keep_warm=prelaunch)
+                if prelaunch:
+                    asyncio.create_task(self.prelaunch_browser())
                 
                 # Update UI
-                self.start_btn.setEnabled(True)
+                self.start_btn.setText("Start")
+                self.start_btn.setToolTip("")
                 self.stop_btn.setEnabled(False)
                 self.progress_bar.setVisible(False)
                 
                 # Stop timers
-                self.timer.stop()
                 self.meeting_timer.stop()
+                self.schedule_timer.stop()
+                if self.frame_probe.timer.isActive():
+                    latency = self.frame_probe.stop()
+                    print(f"[DEBUG] UI frame latency: avg {latency['avg_ms']:.1f} ms, "
+                          f"p95 {latency['p95_ms']:.1f} ms, max {latency['max_ms']:.1f} ms")
                 
                 self.log("Transcript monitoring stopped")
                 
             def save(self):
                 """Save transcript to file."""
-                if not self.transcript_box.toPlainText():
+                if not len(self.active_transcript()):
                     QMessageBox.warning(self, "Error", "No transcript to save")
                     return
                 
@@ -3055,7 +4658,7 @@ def generate_wordcloud(text):
             def save_as_txt(self, file_path):
                 """Save transcript as plain text."""
                 with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(self.transcript_box.toPlainText())
+                    f.write(self.active_transcript().text())
                 
             def save_as_docx(self, file_path):
                 """Save transcript as Word document."""
@@ -3079,9 +4682,8 @@ def generate_wordcloud(text):
                 
                 # Add transcript
                 doc.add_heading("Transcript", 1)
-                for line in self.transcript_box.toPlainText().split('\n'):
-                    if line.strip():
-                        doc.add_paragraph(line)
+                for line in self.active_transcript():
+                    doc.add_paragraph(line.display_text())
                 
                 # Add AI insights if available
                 if self.insights_box.toPlainText():
@@ -3124,7 +4726,7 @@ def generate_wordcloud(text):
             pdf.set_font("Arial", '', 10)
                 
             # Add transcript text
-            transcript_text = self.transcript_box.toPlainText()
+            transcript_text = self.active_transcript().text()
             pdf.multi_cell(0, 5, transcript_text)
                 
             # Add AI insights if available
@@ -3142,68 +4744,22 @@ def generate_wordcloud(text):
                 
             def save_as_srt(self, file_path):
                 """Save transcript as SRT subtitle format."""
-                lines = self.transcript_box.toPlainText().strip().split('\n')
-                srt = ""
+                # Lines without a start time are folded into the preceding cue
+                cues = []
+                for line in self.active_transcript():
+                    if line.start is not None:
+                        cues.append([line.start, line.end, line.content()])
+                    elif cues:
+                        cues[-1][2] += "\n" + line.content()
                 
-                subtitle_index = 1
-                last_timestamp = None
-                current_text = ""
-                
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                
-                    # Check if line starts with timestamp
-                    timestamp_match = re.match(r'\[(\d+:\d+:\d+)\]', line)
-                    if timestamp_match:
-                        # If we had previous text, add it as a subtitle
-                        if last_timestamp and current_text:
-                            start_time = last_timestamp
-                            # Calculate end time (5 seconds after start)
-                            h, m, s = map(int, start_time.split(':'))
-                            start_seconds = h * 3600 + m * 60 + s
-                            end_seconds = start_seconds + 5
-                
-                            end_h, end_remainder = divmod(end_seconds, 3600)
-                            end_m, end_s = divmod(end_remainder, 60)
-                            end_time = f"{end_h:02d}:{end_m:02d}:{end_s:02d}"
-                
-                            # Format for SRT
-                            srt_start = f"{start_time},000"
-                            srt_end = f"{end_time},000"
-                
-                            srt += f"{subtitle_index}\n{srt_start} --> {srt_end}\n{current_text}\n\n"
-                            subtitle_index += 1
-                            current_text = ""
-                
-                        # Get timestamp from current line
-                        last_timestamp = timestamp_match.group(1)
-                        # Remove timestamp from line
-                        line = line[line.find(']')+1:].strip()
-                
-                    # Add line to current text
-                    if current_text:
-                        current_text += "\n"
-                    current_text += line
-                
-                # Add final subtitle
-                if last_timestamp and current_text:
-                    start_time = last_timestamp
-                    # Calculate end time (5 seconds after start)
-                    h, m, s = map(int, start_time.split(':'))
-                    start_seconds = h * 3600 + m * 60 + s
-                    end_seconds = start_seconds + 5
-                
-                    end_h, end_remainder = divmod(end_seconds, 3600)
-                    end_m, end_s = divmod(end_remainder, 60)
-                    end_time = f"{end_h:02d}:{end_m:02d}:{end_s:02d}"
-                
-                    # Format for SRT
-                    srt_start = f"{start_time},000"
-                    srt_end = f"{end_time},000"
-                
-                    srt += f"{subtitle_index}\n{srt_start} --> {srt_end}\n{current_text}\n\n"
+                srt = ""
+                for subtitle_index, (start, end, text) in enumerate(cues, 1):
+                    # Without a captured end time, run until the next cue (at most 5 seconds)
+                    if end is None or end <= start:
+                        end = start + 5
+                        if subtitle_index < len(cues):
+                            end = min(end, max(cues[subtitle_index][0], start + 1))
+                    srt += f"{subtitle_index}\n{format_srt_time(start)} --> {format_srt_time(end)}\n{text}\n\n"
                 
                 # Write to file
                 with open(file_path, "w", encoding="utf-8") as f:
@@ -3276,17 +4832,12 @@ def generate_wordcloud(text):
             """
                 
             # Add transcript with timestamps highlighted
-            transcript_text = self.transcript_box.toPlainText()
             transcript_html = ""
-            for line in transcript_text.split('\n'):
-                if line.strip():
-                    # Highlight timestamps
-                    line_html = re.sub(
-                        r'\[(\d+:\d+:\d+)\]', 
-                        r'<span style="color: #777;">[<strong>\1</strong>]</span>', 
-                        line
-                    )
-                    transcript_html += f"<p>{line_html}</p>\n"
+            for line in self.active_transcript():
+                line_html = line.content()
+                if line.start is not None:
+                    line_html = f'<span style="color: #777;">[<strong>{line.timestamp}</strong>]</span> {line_html}'
+                transcript_html += f"<p>{line_html}</p>\n"
                 
             html += transcript_html
                 
@@ -3356,10 +4907,8 @@ def generate_wordcloud(text):
                 md += "\n## Transcript\n\n"
                 
                 # Add transcript
-                transcript_text = self.transcript_box.toPlainText()
-                for line in transcript_text.split('\n'):
-                    if line.strip():
-                        md += f"{line}  \n"
+                for line in self.active_transcript():
+                    md += f"{line.display_text()}  \n"
                 
                 # Add AI insights if available
                 if self.insights_box.toPlainText():
@@ -3375,7 +4924,7 @@ def generate_wordcloud(text):
                     f.write(md)
             def show_wordcloud(self):
                 """Show word cloud window."""
-                if not self.transcript_box.toPlainText():
+                if not len(self.active_transcript()):
                     QMessageBox.warning(self, "Error", "No transcript available for word cloud")
                     return
                 
@@ -3395,7 +4944,7 @@ def generate_wordcloud(text):
                 
             def refresh_wordcloud(self):
                 """Refresh the word cloud with current transcript."""
-                text = self.transcript_box.toPlainText()
+                text = self.active_transcript().spoken_text()
                 self.signals.update_wordcloud.emit(text)
                 
             def export_wordcloud(self):
@@ -3449,8 +4998,8 @@ def generate_wordcloud(text):
                 self.transcript_box.clear_highlights()
                 self.transcript_box.highlight_text(re.escape(query), "#FFFF99")  # Yellow highlight
                 
-            def append_transcript(self, text):
-                """Append text to transcript with formatting."""
+            def prepare_transcript_text(self, text):
+                """Apply spell checking and anonymization to a transcript line."""
                 # Apply spell checking if enabled
                 if settings.get("spellcheck_enabled", False):
                     text = correct_spelling(text)
@@ -3460,35 +5009,55 @@ def generate_wordcloud(text):
                     text, name_mapping = anonymize_names(text, self.known_names)
                     # Update known names for future anonymization
                     self.known_names = list(name_mapping.keys())
+                return text
+                
+            def prepare_transcript_line(self, line):
+                """Spell check and anonymize a line once, before it is stored."""
+                line.text = self.prepare_transcript_text(line.text)
+                if settings.get("anonymize_transcript", False) and line.speaker:
+                    line.speaker, _ = anonymize_names(line.speaker, self.known_names)
+                return line
                 
+            def append_transcript(self, session, line):
+                """Append a line to a meeting's transcript with formatting."""
                 # Check for code word activation
                 code_word = settings.get("code_word", DEFAULT_CODE_WORD).lower()
-                if code_word and code_word in text.lower() and not self.code_word_detected:
+                if code_word and code_word in line.text.lower() and not self.code_word_detected and session is self.active_session:
                     self.code_word_detected = True
                     self.log(f"Code word '{code_word}' detected. Triggering analysis...")
-                    QTimer.singleShot(500, self.on_demand_analysis)  # Slight delay for visual feedback
+                    QTimer.singleShot(500, lambda: self.request_analysis("code word"))  # Slight delay for visual feedback
                 
-                # Format based on whether it contains a timestamp
-                if text.startswith('[') and ']' in text:
-                    # Split into timestamp and content
-                    timestamp_end = text.find(']') + 1
-                    timestamp = text[:timestamp_end]
-                    content = text[timestamp_end:].strip()
+                # Remember which blocks hold this line so a later revision can re-render just those
+                first_block = session.transcript_box.document().blockCount() - 1
                 
+                # Format based on whether it has a timestamp
+                if line.start is not None:
                     # Add timestamp with gray color
-                    self.transcript_box.append_formatted(
-                        timestamp, {"color": "#888888", "font_size": 12}
+                    session.transcript_box.append_formatted(
+                        f"[{line.timestamp}]", {"color": "#888888", "font_size": 12}
                     )
                 
                     # Add content with normal format
-                    self.transcript_box.append_formatted(
-                        content, {"font_size": settings.get("font_size", DEFAULT_FONT_SIZE)}
+                    session.transcript_box.append_formatted(
+                        line.content(), {"font_size": settings.get("font_size", DEFAULT_FONT_SIZE)}
                     )
+                    session.line_blocks.append((first_block, 2))
                 else:
                     # Insert regular text
-                    self.transcript_box.append_formatted(
-                        text, {"font_size": settings.get("font_size", DEFAULT_FONT_SIZE)}
+                    session.transcript_box.append_formatted(
+                        line.content(), {"font_size": settings.get("font_size", DEFAULT_FONT_SIZE)}
                     )
+                    session.line_blocks.append((first_block, 1))
+                
+            def revise_transcript(self, session, index, line):
+                """Re-render a line Otter revised, touching only its content block."""
+                if index >= len(session.line_blocks):
+                    return
+                first_block, block_count = session.line_blocks[index]
+                session.transcript_box.replace_formatted(
+                    first_block + block_count - 1, line.content(),
+                    {"font_size": settings.get("font_size", DEFAULT_FONT_SIZE)}
+                )
             def append_suggested_response(self, text):
                 """Append text to suggested response box with formatting."""
                 # Format "SUGGESTED RESPONSE:" header in bold blue
@@ -3589,13 +5158,18 @@ def generate_wordcloud(text):
                         "#E0F7FA"  # Light blue highlight
                     )
                 
-            def update_meeting_title(self, title):
+            def update_meeting_title(self, session, title):
                 """Update the detected meeting title."""
                 if not title or title == "Unknown Meeting":
                     return
                 
-                self.meeting_title = title
-                self.topic_value.setText(title)
+                session.meeting_title = title
+                index = self.transcript_tabs.indexOf(session.transcript_box)
+                if index >= 0:
+                    self.transcript_tabs.setTabText(index, title)
+                if session is self.active_session:
+                    self.meeting_title = title
+                    self.topic_value.setText(title)
                 
             def log(self, message):
                 """Update status message."""
@@ -3648,63 +5222,308 @@ def generate_wordcloud(text):
                 """Update meeting timer label."""
                 self.timer_label.setText(time_str)
                 
-            @asyncSlot()
-            async def on_demand_analysis(self):
-                """Trigger AI analysis on demand."""
-                if not self.transcript_box.toPlainText():
+            def on_demand_analysis(self):
+                """Trigger AI analysis on demand; holding Shift skips the response cache and asks the model again."""
+                bypass_cache = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+                self.request_analysis("button", bypass_cache)
+                
+            def request_analysis(self, trigger, bypass_cache=False):
+                """Pass an analysis trigger to the selected meeting's coordinator, which runs one request at a time."""
+                if not len(self.active_transcript()):
                     self.log("No transcript available for analysis")
                     return
                 
-                self.log("Generating AI analysis...")
+                coordinator = self.active_session.analysis
+                outcome = coordinator.request(trigger, bypass_cache)
+                print(f"[DEBUG] analysis trigger '{trigger}': {outcome} ({coordinator.summary()})")
+                if outcome == "queued":
+                    self.log("Analysis in progress; a follow-up will include the newest lines")
+                
+            async def run_analysis(self, session, trigger, bypass_cache=False):
+                """Run one AI analysis of a meeting's transcript, optionally without answers from the response cache."""
+                # Any analysis, including on-demand ones, restarts the schedule's intervals
+                session.schedule.ran(time.monotonic())
+                self.log(f"Generating AI analysis ({trigger})...")
                 self.update_progress(10)
                 
                 # Get current transcript
-                transcript = self.transcript_box.toPlainText()
+                transcript = session.transcript
+                line_count = len(transcript)
                 
-                # Get active prompt
-                prompt_text = ""
-                for p in settings.get("prompts", []):
-                    if p["name"] == settings.get("active_prompt", ""):
-                        prompt_text = p["prompt"]
-                        break
-                
-                if not prompt_text:
-                    prompt_text = DEFAULT_SETTINGS["prompts"][0]["prompt"]
-                
-                # Combine prompt and transcript
-                full_prompt = f"{prompt_text}\n\nCurrent transcript:\n{transcript}"
+                # The active prompt drives the main panels; fan-out prompts run alongside it
+                prompts = self.analysis_prompts()
                 
                 try:
                     # Show progress animation
                     self.update_progress(30)
                 
-                    # Call Groq API
-                    response = groq_client.chat.completions.create(
-                        model=settings.get("model", DEFAULT_MODEL),
-                        messages=[
-                            {"role": "system", "content": "You are an intelligent meeting assistant."},
-                            {"role": "user", "content": full_prompt}
-                        ],
-                        temperature=0.3,
-                        top_p=0.9,
-                        max_tokens=1024
-                    )
-                
-                    self.update_progress(80)
-                
-                    # Extract response
-                    result = response.choices[0].message.content.strip()
-                
-                    # Process response
-                    self.process_groq_response(result)
+                    # Call Groq API without blocking the event loop, so polling and rendering continue
+                    if self.groq_client is None:
+                        self.groq_client = create_groq_client()
+                
+                    # Combine prompt and transcript; the rolling context keeps the prompt size flat over a long meeting,
+                    # and either way the newest lines that fit the model's context window are sent.
+                    # Every prompt gets the same snapshot, sized for the longest prompt.
+                    model = settings.get("model", DEFAULT_MODEL)
+                    budget = min(prompt_budget(model, prompt_text) for _, prompt_text in prompts)
+                    if settings.get("rolling_context", True):
+                        context = session.analysis_context
+                        max_words = settings.get("summary_max_words", 250)
+                        summary_budget = prompt_budget(
+                            settings.get("summary_model") or model, summary_prompt(context.summary, "", max_words), max_words * 2
+                        )
+                        try:
+                            await context.compact(transcript, self.summarize_transcript, summary_budget)
+                        except groq.APIError as e:
+                            # Unsummarized lines are retried on the next analysis
+                            print(f"[DEBUG] running summary update failed: {e}")
+                        # Lines that arrived during the summary update are part of this analysis
+                        line_count = len(transcript)
+                        context_text, dropped = context.build(transcript, budget)
+                    else:
+                        context_text, dropped = assemble_transcript_context(
+                            transcript, budget, heading="Current transcript:"
+                        )
+                    if dropped:
+                        self.log(f"Transcript trimmed to fit {model}: {dropped} older lines left out")
+                
+                    semaphore = asyncio.Semaphore(max(1, settings.get("fanout_parallelism", 3)))
+                    primary_done = asyncio.Event()
+                    started = time.perf_counter()
+                    results = await asyncio.gather(*(
+                        self.run_prompt(
+                            name, prompt_text, context_text, model, index == 0, bypass_cache, semaphore, primary_done,
+                            session.analysis.output_started if index == 0 else None
+                        )
+                        for index, (name, prompt_text) in enumerate(prompts)
+                    ), return_exceptions=True)
+                    wall = time.perf_counter() - started
+                
+                    for (name, _), result in zip(prompts, results):
+                        if isinstance(result, groq.APITimeoutError):
+                            self.log(f"AI analysis ({name}) timed out after {settings.get('analysis_timeout', DEFAULT_ANALYSIS_TIMEOUT)}s")
+                        elif isinstance(result, BaseException):
+                            self.log(f"Error generating analysis ({name}): {result}")
+                    completed = [result for result in results if isinstance(result, dict)]
+                    if not completed:
+                        self.update_progress(0)
+                        return
                 
+                    if settings.get("rolling_context", True):
+                        session.analysis_context.analysis_done(line_count)
                     self.update_progress(100)
-                    self.log("AI analysis complete")
+                    if all(result["cached"] for result in completed):
+                        self.log(f"AI analysis reused from cache ({self.response_cache.summary()})")
+                    elif len(prompts) == 1:
+                        result = completed[0]
+                        self.log(
+                            f"AI analysis complete ({result['prompt_tokens']} prompt tokens, "
+                            f"first token {result['first_token']:.2f}s, total {result['total']:.2f}s)"
+                        )
+                    else:
+                        timings = ", ".join(
+                            f"{result['name']} {'cached' if result['cached'] else format(result['total'], '.2f') + 's'}"
+                            for result in completed
+                        )
+                        self.log(f"AI analysis of {len(completed)} prompts complete in {wall:.2f}s ({timings})")
                 
+                except asyncio.CancelledError:
+                    # Superseded or stopped: clear the progress bar and let the task end cancelled
+                    print("[DEBUG] AI analysis cancelled")
+                    self.update_progress(0)
+                    raise
                 except Exception as e:
                     self.log(f"Error generating analysis: {e}")
                     self.update_progress(0)
                 
+            def analysis_prompts(self):
+                """(name, prompt) pairs to run: the active prompt first, then the fan-out prompts."""
+                prompts = {p["name"]: p["prompt"] for p in settings.get("prompts", [])}
+                active = settings.get("active_prompt", "")
+                if active in prompts:
+                    selected = [(active, prompts[active])]
+                else:
+                    selected = [(DEFAULT_SETTINGS["prompts"][0]["name"], DEFAULT_SETTINGS["prompts"][0]["prompt"])]
+                for name in settings.get("fanout_prompts", []):
+                    if name in prompts and name != selected[0][0]:
+                        selected.append((name, prompts[name]))
+                return selected
+                
+            async def run_prompt(self, name, prompt_text, context_text, model, primary, bypass_cache, semaphore, primary_done,
+                                 on_output=None):
+                """Run one prompt on the shared context; the primary prompt streams into the main panels.
+                
+                Other prompts' answers are held until primary_done is set, so a fan-out section is never
+                appended to the insights box in the middle of the primary answer streaming into it.
+                on_output is called when the answer starts appearing in the panels.
+                """
+                try:
+                    return await self.run_prompt_request(
+                        name, prompt_text, context_text, model, primary, bypass_cache, semaphore, primary_done, on_output
+                    )
+                finally:
+                    if primary:
+                        primary_done.set()
+                
+            async def run_prompt_request(self, name, prompt_text, context_text, model, primary, bypass_cache, semaphore,
+                                         primary_done, on_output=None):
+                """Request (or look up) one prompt's answer and render it once the primary answer is in place."""
+                full_prompt = f"{prompt_text}\n\n{context_text}"
+                request = dict(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": full_prompt}
+                    ],
+                    temperature=0.3,
+                    top_p=0.9,
+                    max_tokens=DEFAULT_ANALYSIS_MAX_TOKENS
+                )
+                
+                # An identical request (hotkey pressed twice, code word right after a line trigger) reuses the last answer
+                use_cache = settings.get("response_cache", True)
+                cache_key = request_digest(request)
+                result = None
+                if use_cache and bypass_cache:
+                    self.response_cache.stats["bypassed"] += 1
+                elif use_cache:
+                    result = self.response_cache.get(cache_key)
+                if result is not None:
+                    if not primary:
+                        await primary_done.wait()
+                    self.render_prompt_result(name, result, primary)
+                    return {"name": name, "cached": True, "prompt_tokens": 0, "first_token": 0.0, "total": 0.0}
+                
+                # The semaphore caps concurrent requests so a long prompt list cannot hit the API all at once
+                async with semaphore:
+                    started = time.perf_counter()
+                    streamed = primary and settings.get("stream_analysis", True)
+                    if streamed:
+                        first_token, usage, result = await self.stream_groq_response(request, started, on_output)
+                    else:
+                        response = await self.groq_client.chat.completions.create(**request)
+                        first_token = time.perf_counter() - started
+                        usage = response.usage
+                        result = response.choices[0].message.content.strip()
+                    total = time.perf_counter() - started
+                
+                self.record_analysis_latency(name, first_token, total)
+                if use_cache:
+                    self.response_cache.put(cache_key, result)
+                    print(f"[DEBUG] response cache: {self.response_cache.summary()}")
+                
+                # Waiting outside the semaphore leaves its slot to prompts still queued for the API
+                if not primary:
+                    await primary_done.wait()
+                if not streamed:
+                    self.render_prompt_result(name, result, primary)
+                return {
+                    "name": name,
+                    "cached": False,
+                    "prompt_tokens": usage.prompt_tokens if usage else estimate_tokens(full_prompt),
+                    "first_token": first_token,
+                    "total": total,
+                }
+                
+            def render_prompt_result(self, name, text, primary):
+                """Show a complete answer: the primary prompt's in the main panels, others as their own insights section."""
+                if primary:
+                    self.process_groq_response(text)
+                    return
+                self.insights_box.end_streamed()
+                self.insights_box.append_formatted(
+                    f"{name.upper()}:",
+                    {
+                        "font_size": 16,
+                        "bold": True,
+                        "color": FANOUT_SECTION_COLOR
+                    }
+                )
+                self.insights_box.append_formatted(text, {"font_size": settings.get("font_size", DEFAULT_FONT_SIZE)})
+                
+            async def stream_groq_response(self, request, started, on_output=None):
+                """Render a completion into the panels as it streams in; returns time to first token, usage and text."""
+                router = SectionRouter()
+                first_token = None
+                usage = None
+                chunks = []
+                stream = await self.groq_client.chat.completions.create(**request, stream=True)
+                async with stream:
+                    async for chunk in stream:
+                        # Groq reports token usage on the final chunk
+                        usage = getattr(getattr(chunk, "x_groq", None), "usage", None) or usage
+                        text = chunk.choices[0].delta.content if chunk.choices else None
+                        if not text:
+                            continue
+                        chunks.append(text)
+                        if first_token is None:
+                            first_token = time.perf_counter() - started
+                            self.update_progress(60)
+                            if on_output is not None:
+                                on_output()
+                        for section, part in router.feed(text):
+                            self.signals.stream_analysis.emit(section, part)
+                for section, part in router.finish():
+                    self.signals.stream_analysis.emit(section, part)
+                self.suggested_response_box.end_streamed()
+                self.insights_box.end_streamed()
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+                return first_token, usage, "".join(chunks).strip()
+                
+            async def summarize_transcript(self, summary, lines_text):
+                """Fold transcript lines into a meeting's running summary (the AnalysisContext.compact callback)."""
+                max_words = settings.get("summary_max_words", 250)
+                response = await self.groq_client.chat.completions.create(
+                    model=settings.get("summary_model") or settings.get("model", DEFAULT_MODEL),
+                    messages=[
+                        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                        {"role": "user", "content": summary_prompt(summary, lines_text, max_words)}
+                    ],
+                    temperature=0.2,
+                    max_tokens=max_words * 2
+                )
+                if response.usage:
+                    print(
+                        f"[DEBUG] running summary updated: {response.usage.prompt_tokens} prompt, "
+                        f"{response.usage.completion_tokens} completion tokens"
+                    )
+                return response.choices[0].message.content
+                
+            def render_analysis_stream(self, section, text):
+                """Render one streamed analysis event; suggested responses and insights go to their own panels."""
+                if section is None:
+                    self.append_insights(text)
+                    return
+                box = self.suggested_response_box if section == "SUGGESTED RESPONSE" else self.insights_box
+                if text is None:
+                    box.end_streamed()
+                    box.append_formatted(
+                        f"{section}:",
+                        {
+                            "font_size": 16,
+                            "bold": True,
+                            "color": ANALYSIS_SECTION_COLORS[section]
+                        }
+                    )
+                else:
+                    box.append_streamed(text, {"font_size": settings.get("font_size", DEFAULT_FONT_SIZE)})
+                
+            def record_analysis_latency(self, name, first_token, total):
+                """Track time to first token and to completion of each prompt across analysis requests."""
+                stats = self.analysis_stats.setdefault(
+                    name, {"requests": 0, "first_token_s": 0.0, "total_s": 0.0, "max_s": 0.0}
+                )
+                stats["requests"] += 1
+                stats["first_token_s"] += first_token
+                stats["total_s"] += total
+                stats["max_s"] = max(stats["max_s"], total)
+                print(
+                    f"[DEBUG] {name} analysis {stats['requests']}: first token {first_token:.2f}s, total {total:.2f}s "
+                    f"(avg {stats['first_token_s'] / stats['requests']:.2f}s / {stats['total_s'] / stats['requests']:.2f}s, "
+                    f"max {stats['max_s']:.2f}s)"
+                )
+                
             def process_groq_response(self, response):
                 """Process the AI response and update UI."""
                 lines = response.split('\n')
@@ -3757,164 +5576,810 @@ def generate_wordcloud(text):
                 if not any(section_content.values()):
                     self.signals.append_insights.emit(response)
                 
-            async def scrape_otter(self, url):
+            async def scrape_otter(self, session):
                 """Scrape Otter.ai transcript."""
-                print("[DEBUG] scrape_otter started")
+                print(f"[DEBUG] scrape_otter started for {session.url}")
                 try:
-                    # Initialize playwright
-                    async with async_playwright() as p:
-                        print("[DEBUG] launching browser")
-                        self.browser = await p.chromium.launch(headless=False, timeout=30000)
-                        self.page = await self.browser.new_page()
+                    session.startup_started = time.perf_counter()
+                    session.startup_timings = {}
                 
-                        # Update status
-                        self.log("Navigating to Otter.ai...")
-                        self.update_progress(30)
+                    # Out of process, the GUI only renders what the scraper process streams back
+                    if settings.get("scraper_process", False):
+                        self.start_scraper_worker(session)
+                        return
                 
-                        # Navigate to URL with longer timeout
-                        try:
-                            await self.page.goto(url, timeout=90000)
-                        except Exception as e:
-                            self.log(f"Navigation timeout, but continuing: {e}")
+                    self.start_line_queue(session)
+                    await self.connect_session(session)
                 
-                        # Wait for content to load
-                        try:
-                            # Try to wait for network idle, but don't fail if it times out
-                            self.log("Waiting for page to load...")
-                            self.update_progress(40)
-                            await self.page.wait_for_load_state("domcontentloaded", timeout=30000)
-                            print("[DEBUG] DOM content loaded, proceeding without waiting for network idle")
-                        except Exception as e:
-                            print(f"[DEBUG] Network idle wait timed out, but continuing: {e}")
-                
-                        # Longer wait for complete page render
-                        print("[DEBUG] sleeping 10s for page render")
-                        self.log("Waiting for page to render...")
-                        self.update_progress(50)
-                        await asyncio.sleep(10)
-                
-                        # Check if login is required
-                        self.log("Checking if login is required...")
-                        self.update_progress(60)
-                        login_elements = await self.page.query_selector_all(
-                            "input[type='password'], input[type='email'], button:has-text('Sign in'), button:has-text('Log in')"
+                    # Start polling for transcript
+                    self.session_log(session, "Starting transcript polling...")
+                    self.update_progress(100)
+                
+                    # With push capture the timer poll only runs as a consistency check
+                    poll_interval = settings.get("poll_interval", DEFAULT_POLL_INTERVAL)
+                    if session.observer_active:
+                        poll_interval = settings.get("consistency_check_interval", 30)
+                
+                    # Set up polling timer; adaptive polling retunes it after every poll
+                    if settings.get("adaptive_polling", True) and not session.observer_active:
+                        poll_interval = min(
+                            max(poll_interval, settings.get("poll_interval_min", 1)),
+                            settings.get("poll_interval_max", 20)
                         )
-                        if login_elements:
-                            self.log("[WARNING] Login might be required. Please log in through the browser window.")
-                            # Wait longer to give user time to log in manually if needed
-                            self.update_progress(65)
-                            await asyncio.sleep(20)
+                    session.poll_stats["interval_s"] = poll_interval
+                    session.timer.timeout.connect(lambda: self.on_poll_tick(session))
+                    session.timer.start(int(poll_interval * 1000))  # convert to ms
+                    await self.poll_transcript(session)
                 
-                        # Try to click 'Accept All Cookies' button if it exists
-                        try:
-                            print("[DEBUG] Looking for cookie consent dialog")
-                            self.log("Handling cookie dialogs if present...")
-                            self.update_progress(70)
-                            accept_buttons = await self.page.query_selector_all(
-                                "button:has-text('Accept'), button:has-text('Accept All'), button:has-text('Allow')"
-                            )
-                            if accept_buttons:
-                                print("[DEBUG] Clicking cookie accept button")
-                                await accept_buttons[0].click()
-                                # Wait for dialog to close
-                                await asyncio.sleep(2)
-                            else:
-                                print("[DEBUG] No cookie dialog found")
-                        except Exception as e:
-                            print(f"[DEBUG] Error handling cookie dialog: {e}")
+                except Exception as e:
+                    self.session_log(session, f"Error: {e}")
+                    await self.stop_session(session)
+                
+            async def follow_source(self, session):
+                """Read a transcript file or replay on the poll timer instead of scraping Otter."""
+                session.startup_started = time.perf_counter()
+                session.startup_timings = {}
+                self.update_meeting_title(session, session.source.title)
+                self.session_log(session, f"Reading {session.source.describe()}...")
+                self.update_progress(100)
+                
+                poll_interval = settings.get("source_poll_interval", 0.5)
+                session.poll_stats["interval_s"] = poll_interval
+                session.timer.timeout.connect(lambda: self.on_poll_tick(session))
+                session.timer.start(int(poll_interval * 1000))
+                await self.poll_transcript(session)
+                
+            async def poll_source(self, session):
+                """Ingest the lines a transcript source has produced since the last poll."""
+                if not self.running or not session.active:
+                    return
                 
-                        # Start polling for transcript
-                        self.log("Starting transcript polling...")
-                        self.update_progress(100)
+                session.poll_in_flight = True
+                try:
+                    poll_started = time.perf_counter()
+                    records = session.source.read()
+                    self.record_poll_latency(session, time.perf_counter() - poll_started)
+                    await self.ingest_transcript_records(session, records)
+                    if session.source.finished:
+                        session.timer.stop()
+                        self.session_log(session, f"Replay finished ({len(session.transcript)} lines)")
+                except OSError as e:
+                    print(f"[DEBUG] Error reading {session.source.describe()}: {e}")
+                finally:
+                    session.poll_in_flight = False
+                
+            async def connect_session(self, session):
+                """Open the meeting page, catch up on missed lines and start live capture."""
+                # Reuse a saved Otter login headlessly; fall back to a visible window when it has expired
+                headless = self.startup_headless()
+                if not await self.open_meeting(session, headless):
+                    self.session_log(session, "Saved Otter login has expired. Reopening the browser so you can sign in...")
+                    await self.close_session_page(session)
+                    await self.open_meeting(session, headless=False)
+                
+                total = time.perf_counter() - session.startup_started
+                steps = ", ".join(f"{name} {elapsed:.1f}s" for name, elapsed in session.startup_timings.items())
+                self.session_log(session, f"Page ready in {total:.1f}s ({steps})")
+                self.report_blocked_requests(session)
+                
+                # Lines scrolled out of the virtualized list never reach the DOM poll, so collect them first
+                if settings.get("scroll_harvest", True) and session.capture_source != "network":
+                    await self.harvest_transcript(session, "connect")
+                
+                # Prefer push-based capture over polling
+                session.observer_active = False
+                if settings.get("push_capture", True):
+                    try:
+                        await self.start_push_capture(session)
+                        self.session_log(session, "Live transcript capture enabled")
+                    except Exception as e:
+                        print(f"[DEBUG] Push capture unavailable, falling back to polling: {e}")
+                
+            async def get_browser(self, headless):
+                """Return the shared browser for this mode, launching it on first use."""
+                # Sessions open concurrently, so serialize launches to keep one browser per mode
+                async with self.browser_lock:
+                    if self.playwright is None:
+                        # Playwright stays running until stop() so pages outlive the call that opened them
+                        self.playwright = await async_playwright().start()
+                    browser = self.browsers.get(headless)
+                    if browser is None or not browser.is_connected():
+                        print(f"[DEBUG] launching browser (headless={headless})")
+                        browser = await self.playwright.chromium.launch(headless=headless, timeout=30000)
+                        browser.on("disconnected", lambda closed: self.on_browser_disconnected(headless, closed))
+                        self.browsers[headless] = browser
+                    return browser
+                
+            def startup_headless(self):
+                """Whether the next meeting opens headless, which needs a saved Otter login."""
+                state_path = settings.get("storage_state_path", DEFAULT_STORAGE_STATE_PATH)
+                return settings.get("headless_when_authenticated", True) and os.path.exists(state_path)
+                
+            def prelaunch_wanted(self):
+                """Whether to keep a warm browser in this process; scraper processes launch their own."""
+                return settings.get("prelaunch_browser", True) and not settings.get("scraper_process", False)
+                
+            async def prelaunch_browser(self):
+                """Launch the browser the next Start will use before the user clicks it."""
+                started = time.perf_counter()
+                try:
+                    await self.get_browser(self.startup_headless())
+                    print(f"[DEBUG] warm browser ready in {time.perf_counter() - started:.1f}s")
+                except Exception as e:
+                    print(f"[DEBUG] Browser pre-launch failed, Start will launch one: {e}")
                 
-                        # Set up polling timer
-                        poll_interval = settings.get("poll_interval", DEFAULT_POLL_INTERVAL) * 1000  # convert to ms
-                        self.timer.timeout.connect(lambda: asyncio.create_task(self.poll_transcript()))
-                        self.timer.start(poll_interval)
+            def on_browser_disconnected(self, headless, browser):
+                """Forget a browser that crashed or was closed and warm up a replacement."""
+                # close_browser() empties the registry first, so intentional closes stop here
+                if self.browsers.get(headless) is not browser:
+                    return
+                del self.browsers[headless]
+                print(f"[DEBUG] browser disconnected (headless={headless})")
+                if self.prelaunch_wanted() and headless == self.startup_headless():
+                    self.log("Browser closed unexpectedly. Relaunching it in the background...")
+                    asyncio.create_task(self.prelaunch_browser())
+                
+            async def open_meeting(self, session, headless):
+                """Open the meeting in its own browser context and run the readiness steps."""
+                state_path = settings.get("storage_state_path", DEFAULT_STORAGE_STATE_PATH)
+                warm = self.browsers.get(headless)
+                session.warm_start = warm is not None and warm.is_connected()
+                browser_started = time.perf_counter()
+                browser = await self.get_browser(headless)
+                session.startup_timings["browser"] = time.perf_counter() - browser_started
+                # Each meeting gets an isolated context; the browser process itself is shared
+                session.context = await browser.new_context(
+                    storage_state=state_path if os.path.exists(state_path) else None
+                )
+                if settings.get("resource_filter", True):
+                    await self.start_resource_filter(session)
+                session.page = await session.context.new_page()
+                page = session.page
+                page.on("crash", lambda _: self.on_page_lost(session, page, "crashed"))
+                page.on("close", lambda _: self.on_page_lost(session, page, "closed"))
+                if settings.get("network_capture", True):
+                    self.start_network_capture(session)
+                
+                # Readiness probes replace fixed sleeps; each step waits on a concrete page condition
+                await self.run_startup_step(session, "navigate", 30, self.navigate_to_meeting)
+                await self.run_startup_step(session, "render", 45, self.wait_for_render)
+                
+                # Nobody can sign in to a hidden window, so let the caller reopen it headed
+                if headless and await session.page.query_selector(LOGIN_FORM_SELECTOR):
+                    return False
+                await self.run_startup_step(session, "login", 60, self.wait_for_login)
+                await self.run_startup_step(session, "cookies", 70, self.dismiss_cookie_banner)
+                await self.run_startup_step(session, "transcript", 85, self.wait_for_transcript_container)
                 
+                # Persist cookies and local storage so the next run can start headless
+                try:
+                    await session.context.storage_state(path=state_path)
                 except Exception as e:
-                    self.log(f"Error: {e}")
-                    self.stop()
+                    print(f"[DEBUG] Error saving browser storage state: {e}")
+                return True
+                
+            async def close_session_page(self, session):
+                """Close a session's browser context and forget its page."""
+                # Forget the page first so its close event is not mistaken for a crash
+                context = session.context
+                session.context = None
+                session.page = None
+                if context:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        print(f"Error closing browser context: {e}")
+                
+            async def close_browser(self, keep_warm=False):
+                """Close the shared browsers and the Playwright driver, optionally keeping the warm browser."""
+                warm_headless = self.startup_headless() if keep_warm else None
+                browsers, self.browsers = self.browsers, {}
+                for headless, browser in browsers.items():
+                    if headless == warm_headless and browser.is_connected():
+                        self.browsers[headless] = browser
+                        continue
+                    try:
+                        await browser.close()
+                    except Exception as e:
+                        print(f"Error closing browser: {e}")
+                if not self.browsers and self.playwright:
+                    try:
+                        await self.playwright.stop()
+                    except Exception as e:
+                        print(f"Error stopping Playwright: {e}")
+                    self.playwright = None
+                
+            def forget_saved_login(self):
+                """Delete the saved Otter login so the next start opens a visible browser."""
+                state_path = settings.get("storage_state_path", DEFAULT_STORAGE_STATE_PATH)
+                if os.path.exists(state_path):
+                    os.remove(state_path)
+                self.log("Saved Otter login cleared. The next start will open the browser for sign-in.")
+                
+            async def run_startup_step(self, session, name, progress, step):
+                """Run one readiness step under its own timeout and record how long it took."""
+                session.startup_state = name
+                self.update_progress(progress)
+                timeout = settings.get("startup_timeouts", {}).get(name, DEFAULT_STARTUP_TIMEOUTS[name])
+                step_started = time.perf_counter()
+                try:
+                    await step(session, timeout * 1000)  # Playwright timeouts are in ms
+                except Exception as e:
+                    self.session_log(session, f"Startup step '{name}' did not complete, continuing: {e}")
+                elapsed = time.perf_counter() - step_started
+                session.startup_timings[name] = elapsed
+                print(f"[DEBUG] {session.label} startup step {name} took {elapsed:.2f}s")
+                
+            async def navigate_to_meeting(self, session, timeout):
+                """Open the meeting URL and wait for the DOM to be parsed."""
+                self.session_log(session, "Navigating to Otter.ai...")
+                await session.page.goto(session.url, wait_until="domcontentloaded", timeout=timeout)
+                
+            async def wait_for_render(self, session, timeout):
+                """Wait until the app has rendered either the transcript or a login form."""
+                self.session_log(session, "Waiting for page to render...")
+                await session.page.wait_for_selector(
+                    f"{TRANSCRIPT_CONTAINER_SELECTOR}, {LOGIN_FORM_SELECTOR}", timeout=timeout
+                )
                 
-            async def poll_transcript(self):
+            async def wait_for_login(self, session, timeout):
+                """If a login form is showing, wait for the user to complete it."""
+                if not await session.page.query_selector(LOGIN_FORM_SELECTOR):
+                    return
+                self.session_log(session, "[WARNING] Login required. Please log in through the browser window.")
+                await session.page.wait_for_selector(LOGIN_FORM_SELECTOR, state="detached", timeout=timeout)
+                self.session_log(session, "Login complete")
+                
+            async def dismiss_cookie_banner(self, session, timeout):
+                """Accept the cookie banner if one appears and wait for it to close."""
+                self.session_log(session, "Handling cookie dialogs if present...")
+                accept_button = await session.page.query_selector(COOKIE_ACCEPT_SELECTOR)
+                if not accept_button or not await accept_button.is_visible():
+                    print("[DEBUG] No cookie dialog found")
+                    return
+                print("[DEBUG] Clicking cookie accept button")
+                await accept_button.click()
+                await session.page.wait_for_selector(COOKIE_ACCEPT_SELECTOR, state="hidden", timeout=timeout)
+                
+            async def wait_for_transcript_container(self, session, timeout):
+                """Wait for the transcript container to be attached."""
+                self.session_log(session, "Waiting for transcript...")
+                await session.page.wait_for_selector(TRANSCRIPT_CONTAINER_SELECTOR, timeout=timeout)
+                
+            def on_page_lost(self, session, page, reason):
+                """Reconnect a session whose page crashed or closed unexpectedly."""
+                if page is not session.page or not session.active:
+                    return
+                asyncio.create_task(self.reconnect_session(session, reason))
+                
+            async def reconnect_session(self, session, reason):
+                """Reopen a session's page with backoff and resume after the lines already committed."""
+                if session.reconnecting or not session.active or not self.running:
+                    return
+                session.reconnecting = True
+                delay = settings.get("reconnect_initial_delay", 2)
+                attempt = 0
+                try:
+                    while self.running and session.active:
+                        attempt += 1
+                        self.session_log(session, f"Transcript page {reason}. Reconnecting (attempt {attempt})...")
+                        await self.close_session_page(session)
+                        try:
+                            # The store, dedup index and emitted offset are kept, so nothing is re-emitted
+                            session.startup_started = time.perf_counter()
+                            session.startup_timings = {}
+                            await self.connect_session(session)
+                            if not await session.page.query_selector(TRANSCRIPT_CONTAINER_SELECTOR):
+                                raise RuntimeError("transcript did not load")
+                            session.poll_errors = 0
+                            session.reconnects += 1
+                            self.session_log(session, f"Reconnected; resuming after line {len(session.transcript)}")
+                            return
+                        except Exception as e:
+                            print(f"[DEBUG] {session.label} reconnect attempt {attempt} failed: {e}")
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 2, settings.get("reconnect_max_delay", 60))
+                finally:
+                    session.reconnecting = False
+                
+            def on_poll_tick(self, session):
+                """Start a poll unless the previous one is still running."""
+                if session.poll_in_flight:
+                    session.poll_stats["skipped"] += 1
+                    print(f"[DEBUG] {session.label} poll still running, skipped tick ({session.poll_stats['skipped']} total)")
+                    return
+                asyncio.create_task(self.poll_transcript(session))
+                
+            async def poll_transcript(self, session):
                 """Poll transcript content from Otter.ai."""
-                if not self.running or not self.page:
+                if session.source is not None:
+                    await self.poll_source(session)
+                    return
+                if not self.running or not session.active or session.reconnecting or not session.page:
                     return
                 
+                session.poll_in_flight = True
                 try:
                     # Try to get meeting title if not already detected
-                    if self.meeting_title == "Unknown Meeting":
+                    if session.meeting_title == "Unknown Meeting":
                         try:
-                            title_element = await self.page.query_selector("h1.title")
+                            title_element = await session.page.query_selector("h1.title")
                             if title_element:
                                 title = await title_element.inner_text()
                                 if title and title.strip():
-                                    self.signals.detected_meeting_title.emit(title.strip())
+                                    self.signals.detected_meeting_title.emit(session, title.strip())
                         except Exception as e:
                             print(f"[DEBUG] Error getting meeting title: {e}")
                 
+                    # Network capture is authoritative while it delivers lines; DOM scraping is the fallback.
+                    # The page still has to be alive, or a crashed tab would never be reconnected
+                    if self.network_capture_live(session):
+                        if not await session.page.query_selector(TRANSCRIPT_CONTAINER_SELECTOR):
+                            raise RuntimeError("transcript container is missing")
+                        session.poll_errors = 0
+                        return
+                
                     # Get all transcript lines
-                    transcript_elements = await self.page.query_selector_all(
-                        "#__next .transcriptContainer .line, .transcript-container .transcript-element"
-                    )
+                    poll_started = time.perf_counter()
+                    if settings.get("batched_extraction", True):
+                        records = await extract_transcript_records(session.page)
+                    else:
+                        line_texts = await extract_transcript_lines_per_element(session.page)
+                        records = [line_text_record(line_text) for line_text in line_texts]
+                    self.record_poll_latency(session, time.perf_counter() - poll_started)
+                
+                    # An empty poll is only a problem if the transcript itself has gone (navigated away)
+                    if not records and not await session.page.query_selector(TRANSCRIPT_CONTAINER_SELECTOR):
+                        raise RuntimeError("transcript container is missing")
+                
+                    # No overlap with what we already have means lines slipped past between polls
+                    if (settings.get("scroll_harvest", True) and records and len(session.transcript)
+                            and not any(self.is_known_line(session, record) for record in records)):
+                        new_line_count = await self.harvest_transcript(session, "gap")
+                    else:
+                        new_line_count = await self.ingest_transcript_records(session, records)
+                    if settings.get("adaptive_polling", True) and not session.observer_active:
+                        self.adapt_poll_interval(session, new_line_count)
                 
-                    new_content = False
+                    # In push mode this poll is only a consistency check, so make sure the observer survived
+                    if session.observer_active:
+                        observer_alive = await session.page.evaluate("() => !!window.__mapObserver")
+                        if not observer_alive:
+                            print("[DEBUG] transcript observer missing, reinstalling")
+                            await self.install_transcript_observer(session)
                 
-                    for element in transcript_elements:
-                        try:
-                            line_text = await element.inner_text()
-                            line_text = line_text.strip()
-                
-                            if not line_text:
-                                continue
-                
-                            # Only process lines we haven't seen before
-                            line_hash = hash(line_text)
-                            if line_hash not in self.seen_lines:
-                                self.seen_lines.add(line_hash)
-                                self.buffer.append(line_text)
-                                new_content = True
-                        except Exception as e:
-                            print(f"[DEBUG] Error processing transcript line: {e}")
-                
-                    if new_content:
-                        # Get formatted lines with timestamps
-                        formatted_lines = []
-                        line_count = 0
-                
-                        for line in self.buffer:
-                            # Try to extract timestamp if not already present
-                            if not line.startswith('['):
-                                try:
-                                    # Look for timestamp in span
-                                    time_match = re.search(r'\b(\d{1,2}:\d{2}:\d{2})\b', line)
-                                    if time_match:
-                                        timestamp = time_match.group(1)
-                                        # Remove timestamp from text
-                                        text = re.sub(r'\b\d{1,2}:\d{2}:\d{2}\b', '', line).strip()
-                                        formatted_lines.append(f"[{timestamp}] {text}")
-                                    else:
-                                        formatted_lines.append(line)
-                                except Exception as e:
-                                    formatted_lines.append(line)
-                            else:
-                                formatted_lines.append(line)
+                    session.poll_errors = 0
                 
-                            line_count += 1
+                except Exception as e:
+                    print(f"[DEBUG] Error polling transcript: {e}")
+                    # A page that keeps failing is stale; reopen it rather than failing every tick
+                    session.poll_errors += 1
+                    if session.poll_errors >= settings.get("reconnect_after_errors", 3):
+                        # Count afresh so polls before the reconnect starts do not queue more of them
+                        session.poll_errors = 0
+                        asyncio.create_task(self.reconnect_session(session, "stopped responding"))
+                finally:
+                    session.poll_in_flight = False
+                
+            async def ingest_transcript_records(self, session, records):
+                """Commit unseen transcript lines, revise recent ones in place and emit new lines past the emitted offset."""
+                if session.content_keyed:
+                    records = [content_record(record) for record in records]
+                revised = reconcile_records(
+                    records, session.transcript, session.seen_lines, session.recent_lines, self.prepare_transcript_line
+                )
+                for index in revised:
+                    if index < session.emitted_offset:
+                        self.signals.revise_transcript.emit(session, index, session.transcript[index])
+                if revised:
+                    print(f"[DEBUG] {session.label} revised {len(revised)} lines in place")
+                
+                new_lines = self.commit_new_lines(session)
+                trigger = self.analysis_due(session, len(new_lines))
+                if trigger:
+                    # The poll finishes while the analysis request is in flight
+                    self.request_analysis(trigger)
+                return len(new_lines) + len(revised)
+                
+            def commit_new_lines(self, session):
+                """Emit the lines stored past the emitted offset and return them."""
+                new_lines = session.transcript[session.emitted_offset:]
+                if not new_lines:
+                    return new_lines
+                
+                if session.emitted_offset == 0 and session.startup_started is not None:
+                    first_line = time.perf_counter() - session.startup_started
+                    session.startup_timings["first_line"] = first_line
+                    browser_state = "warm" if session.warm_start else "cold"
+                    self.session_log(session, f"First transcript line after {first_line:.1f}s ({browser_state} browser)")
+                
+                # Advance the cursor before emitting so re-entrant ingestion never re-emits these lines
+                session.emitted_offset = len(session.transcript)
+                for line in new_lines:
+                    self.signals.append_transcript.emit(session, line)
+                if session.analysis is not None and session.analysis.lines_committed():
+                    print(f"[DEBUG] {session.label} analysis restarted on the newest lines ({session.analysis.summary()})")
+                return new_lines
+                
+            def analysis_due(self, session, new_line_count):
+                """Count new lines and return the trigger if the meeting's schedule is due; analysis follows the visible meeting."""
+                session.schedule.add_lines(new_line_count)
+                if session is not self.active_session:
+                    return None
+                trigger, reason = session.schedule.check(time.monotonic())
+                if reason:
+                    print(f"[DEBUG] {session.label} analysis schedule: {reason}")
+                return trigger
+                
+            def check_analysis_schedule(self):
+                """Timer tick: let the selected meeting's schedule fire its time-based trigger without new lines arriving."""
+                session = self.active_session
+                if session is None or not session.active:
+                    return
+                trigger = self.analysis_due(session, 0)
+                if trigger:
+                    self.request_analysis(trigger)
+                
+            def start_line_queue(self, session):
+                """Create the queue that pushed and network-captured records are ingested from."""
+                session.line_queue = asyncio.Queue()
+                session.push_consumer_task = asyncio.create_task(self.consume_transcript_queue(session))
+                
+            async def start_push_capture(self, session):
+                """Install the in-page observer that pushes new transcript lines to Python."""
+                await session.page.expose_function(
+                    TRANSCRIPT_PUSH_BINDING, lambda records: self.on_transcript_push(session, records)
+                )
+                await self.install_transcript_observer(session)
+                session.observer_active = True
+                
+            async def install_transcript_observer(self, session):
+                """Attach the MutationObserver to the transcript in the session's page."""
+                await session.page.evaluate(
+                    TRANSCRIPT_OBSERVER_JS,
+                    [TRANSCRIPT_LINE_SELECTOR, TRANSCRIPT_PUSH_BINDING, settings.get("push_debounce_ms", 150)]
+                )
                 
-                        # Add new lines to transcript
-                        for line in formatted_lines:
-                            self.signals.append_transcript.emit(line)
+            def on_transcript_push(self, session, records):
+                """Receive records pushed from the page and queue them for ingestion."""
+                if session.line_queue is not None:
+                    session.line_queue.put_nowait(("dom", records))
+                
+            async def consume_transcript_queue(self, session):
+                """Ingest pushed transcript records as soon as they arrive."""
+                while self.running and session.active:
+                    source, records = await session.line_queue.get()
+                    # While harvesting, scrolling mounts old rows; the harvest ingests them in order itself
+                    if source == "dom" and (session.harvesting or self.network_capture_live(session)):
+                        continue
+                    try:
+                        await self.ingest_transcript_records(session, records)
+                    except Exception as e:
+                        print(f"[DEBUG] Error ingesting pushed transcript lines: {e}")
                 
-                        # Check if we should trigger analysis based on line interval
-                        line_interval = settings.get("summary_line_interval", 10)
-                        if line_count >= line_interval:
-                            # Reset buffer and trigger analysis
-                            self.buffer = []
-                            await self.on_demand_analysis()
+            def start_network_capture(self, session):
+                """Decode transcript payloads straight from Otter's XHR responses and WebSocket frames."""
+                session.page.on("response", lambda response: self.on_transcript_response(session, response))
+                session.page.on("websocket", lambda websocket: self.on_transcript_websocket(session, websocket))
                 
-                except Exception as e:
-                    print(f"[DEBUG] Error polling transcript: {e}")
+            async def on_transcript_response(self, session, response):
+                """Parse transcript segments out of Otter API responses."""
+                if response.request.resource_type not in ("xhr", "fetch"):
+                    return
+                if not TRANSCRIPT_URL_PATTERN.search(response.url):
+                    return
+                try:
+                    payload = await response.json()
+                except Exception:
+                    return
+                self.queue_network_records(session, parse_transcript_payload(payload))
+                
+            def on_transcript_websocket(self, session, websocket):
+                """Listen to frames on Otter's live transcript sockets."""
+                if "otter.ai" in websocket.url:
+                    websocket.on("framereceived", lambda payload: self.on_transcript_frame(session, payload))
+                
+            def on_transcript_frame(self, session, payload):
+                """Parse transcript segments out of a WebSocket frame."""
+                payload = decode_socket_frame(payload)
+                if payload is not None:
+                    self.queue_network_records(session, parse_transcript_payload(payload))
+                
+            def queue_network_records(self, session, records):
+                """Queue network-decoded records and make the network the transcript source."""
+                if not records or session.line_queue is None:
+                    return
+                session.network_records_at = time.monotonic()
+                if session.capture_source != "network":
+                    self.switch_capture_source(session, "network")
+                    self.session_log(session, "Capturing transcript from Otter network traffic")
+                session.line_queue.put_nowait(("network", records))
+                
+            def network_capture_live(self, session):
+                """Whether network capture is still delivering lines; hands capture back to the page once it stalls."""
+                if session.capture_source != "network":
+                    return False
+                stalled_for = time.monotonic() - session.network_records_at
+                if stalled_for < settings.get("network_stall_timeout", 30):
+                    return True
+                self.switch_capture_source(session, "dom")
+                self.session_log(session, f"No transcript traffic for {stalled_for:.0f}s; capturing from the page again")
+                return False
+                
+            def switch_capture_source(self, session, source):
+                """Take lines from another source, lining its records up with the lines already committed."""
+                session.capture_source = source
+                if not len(session.transcript):
+                    return
+                # Otter's segment IDs, the page's element IDs and their timestamp formats never match each
+                # other, so from here on lines are matched by speaker, start second and text
+                session.content_keyed = True
+                for entry in session.recent_lines:
+                    entry[0] = content_record(entry[0])
+                    session.seen_lines.add(line_identity(entry[0]))
+                
+            def start_scraper_worker(self, session, headless=None):
+                """Run this session's browser, polling and line normalization in a separate process."""
+                if headless is None:
+                    headless = self.startup_headless()
+                connection, worker_connection = multiprocessing.Pipe()
+                session.worker = multiprocessing.Process(
+                    target=run_scraper_worker,
+                    args=(session.url, worker_connection, scraper_worker_options(headless)),
+                    daemon=True
+                )
+                session.worker.start()
+                # Drop our copy of the worker's end so recv() sees EOF when the process exits
+                worker_connection.close()
+                session.worker_connection = connection
+                threading.Thread(target=self.read_worker_messages, args=(session, connection), daemon=True).start()
+                self.session_log(session, "Starting scraper process...")
+                self.update_progress(100)
+                
+            def read_worker_messages(self, session, connection):
+                """Forward scraper process messages to the GUI thread (runs on a reader thread)."""
+                try:
+                    while True:
+                        self.signals.worker_message.emit(session, connection.recv())
+                except (EOFError, OSError):
+                    self.signals.worker_message.emit(session, ("closed", connection))
+                
+            def on_worker_message(self, session, message):
+                """Apply lines streamed from a scraper process; they arrive already reconciled and normalized."""
+                kind = message[0]
+                if kind == "lines":
+                    for fields in message[1]:
+                        session.transcript.append(TranscriptLine(*fields))
+                    new_lines = self.commit_new_lines(session)
+                    trigger = self.analysis_due(session, len(new_lines))
+                    if trigger:
+                        self.request_analysis(trigger)
+                elif kind == "revise":
+                    index, line = message[1], TranscriptLine(*message[2])
+                    session.transcript[index] = line
+                    if index < session.emitted_offset:
+                        self.revise_transcript(session, index, line)
+                elif kind == "title":
+                    self.update_meeting_title(session, message[1])
+                elif kind == "status":
+                    self.session_log(session, message[1])
+                elif kind == "login_required" and session.active:
+                    self.session_log(session, "Saved Otter login has expired. Reopening the browser so you can sign in...")
+                    asyncio.create_task(self.restart_scraper_worker(session, headless=False))
+                elif kind == "closed" and session.active and message[1] is session.worker_connection:
+                    # A process replaced by restart_scraper_worker is not reported
+                    self.session_log(session, "Scraper process exited")
+                
+            async def restart_scraper_worker(self, session, headless):
+                """Replace a session's scraper process, e.g. with a visible one so the user can sign in."""
+                await self.stop_scraper_worker(session)
+                if session.active and self.running:
+                    self.start_scraper_worker(session, headless)
+                
+            async def stop_scraper_worker(self, session):
+                """Ask a session's scraper process to stop, terminating it if it does not exit."""
+                if session.worker is None:
+                    return
+                worker, session.worker = session.worker, None
+                try:
+                    session.worker_connection.send(("stop",))
+                except (OSError, ValueError):
+                    pass
+                await asyncio.get_running_loop().run_in_executor(None, worker.join, 10)
+                if worker.is_alive():
+                    worker.terminate()
+                session.worker_connection = None
+                
+            def is_known_line(self, session, record):
+                """Whether a record is a line, or a revision of a line, already in the session's transcript."""
+                return line_identity(record) in session.seen_lines or (
+                    match_revised_line(record, session.recent_lines) is not None
+                )
+                
+            async def harvest_transcript(self, session, reason):
+                """Scroll back through the transcript, ingest missed lines in order and report coverage."""
+                session.harvesting = True
+                started = time.perf_counter()
+                try:
+                    records, steps, state = await harvest_transcript_records(
+                        session.page, lambda record: self.is_known_line(session, record)
+                    )
+                    new_line_count = await self.ingest_transcript_records(session, records)
+                finally:
+                    session.harvesting = False
+                
+                captured = len(session.transcript)
+                expected = max(state["estimatedLines"], captured)
+                session.coverage = {"expected": expected, "captured": captured}
+                print(f"[DEBUG] {session.label} {reason} harvest: {new_line_count} lines in {steps} scroll steps "
+                      f"({time.perf_counter() - started:.1f}s)")
+                self.session_log(
+                    session,
+                    f"Transcript coverage: {captured} of ~{expected} lines ({100 * captured // max(expected, 1)}%)"
+                )
+                return new_line_count
+                
+            async def start_resource_filter(self, session):
+                """Route every request in the session's context through the resource filter."""
+                allowed_types = set(settings.get("allowed_resource_types", DEFAULT_ALLOWED_RESOURCE_TYPES))
+                allowed_domains = settings.get("allowed_domains", DEFAULT_ALLOWED_DOMAINS)
+                blocked_domains = settings.get("blocked_domains", DEFAULT_BLOCKED_DOMAINS)
+                
+                async def filter_request(route):
+                    request = route.request
+                    if should_block_request(
+                        request.resource_type, request.url, allowed_types, allowed_domains, blocked_domains
+                    ):
+                        session.blocked_requests += 1
+                        session.blocked_bytes += TYPICAL_RESOURCE_BYTES.get(request.resource_type, 5000)
+                        await route.abort()
+                    else:
+                        await route.continue_()
+                
+                await session.context.route("**/*", filter_request)
+                
+            def report_blocked_requests(self, session):
+                """Log how many requests the resource filter has saved a session."""
+                if session.blocked_requests:
+                    # Blocked requests are never sent, so their size is estimated from typical transfer sizes
+                    saved_mb = session.blocked_bytes / (1024 * 1024)
+                    self.session_log(
+                        session,
+                        f"Blocked {session.blocked_requests} page requests (an estimated {saved_mb:.1f} MB not downloaded)"
+                    )
+                
+            def adapt_poll_interval(self, session, new_line_count):
+                """Retune the session's poll timer from whether the last poll found new lines."""
+                current = session.poll_stats["interval_s"]
+                interval = next_poll_interval(
+                    current, new_line_count,
+                    settings.get("poll_interval_min", 1),
+                    settings.get("poll_interval_max", 20),
+                    settings.get("poll_backoff", 2.0)
+                )
+                if interval != current:
+                    session.poll_stats["interval_s"] = interval
+                    session.timer.setInterval(int(interval * 1000))
+                    print(f"[DEBUG] {session.label} poll interval {current:g}s -> {interval:g}s ({self.poll_summary(session)})")
+                
+            def record_poll_latency(self, session, elapsed):
+                """Track how long each transcript poll takes to extract its lines; reported by poll_summary."""
+                elapsed_ms = elapsed * 1000
+                session.poll_stats["polls"] += 1
+                session.poll_stats["last_ms"] = elapsed_ms
+                session.poll_stats["max_ms"] = max(session.poll_stats["max_ms"], elapsed_ms)
+                session.poll_stats["total_ms"] += elapsed_ms
+                
+            def poll_summary(self, session):
+                """Poll count, extraction latency and skipped ticks so far, for the debug log."""
+                stats = session.poll_stats
+                if not stats["polls"]:
+                    return "no polls"
+                return (
+                    f"{stats['polls']} polls, avg {stats['total_ms'] / stats['polls']:.1f} ms, "
+                    f"max {stats['max_ms']:.1f} ms, {stats['skipped']} ticks skipped"
+                )
+                
+            # --------------------------
+            # Meeting Sessions
+            # --------------------------
+            def create_transcript_box(self):
+                """Create a read-only transcript box with modern styling."""
+                transcript_box = CustomTextEdit()
+                transcript_box.setReadOnly(True)
+                transcript_box.document().setDefaultFont(
+                    QFont(settings.get("font_family", "SF Pro Text"), 
+                        settings.get("font_size", DEFAULT_FONT_SIZE))
+                )
+                transcript_box.setStyleSheet("""
+                    QTextEdit {
+                        border: none;
+                        border-bottom-left-radius: 8px;
+                        border-bottom-right-radius: 8px;
+                        background-color: transparent;
+                        padding: 12px;
+                    }
+                """)
+                return transcript_box
+                
+            def add_session(self, url, source=None):
+                """Create a session and transcript tab for one meeting URL or transcript source."""
+                session = MeetingSession(self.next_session_id, url, source)
+                session.analysis = AnalysisCoordinator(
+                    lambda trigger, bypass_cache: self.run_analysis(session, trigger, bypass_cache),
+                    lambda: len(session.transcript),
+                    settings.get("stale_analysis_lines", 20)
+                )
+                self.next_session_id += 1
+                session.transcript_box = self.create_transcript_box()
+                self.sessions.append(session)
+                self.transcript_tabs.addTab(session.transcript_box, session.label)
+                if self.active_session is None:
+                    self.transcript_tabs.setCurrentWidget(session.transcript_box)
+                return session
+                
+            async def stop_session(self, session):
+                """Stop capturing one meeting and release its browser context."""
+                if not session.active:
+                    return
+                session.active = False
+                session.timer.stop()
+                if session.push_consumer_task:
+                    session.push_consumer_task.cancel()
+                    session.push_consumer_task = None
+                session.line_queue = None
+                session.observer_active = False
+                session.analysis.cancel()
+                print(f"[DEBUG] {session.label} analysis: {session.analysis.summary()}")
+                print(f"[DEBUG] {session.label} polling: {self.poll_summary(session)}")
+                self.report_blocked_requests(session)
+                await self.stop_scraper_worker(session)
+                await self.close_session_page(session)
+                print(f"[DEBUG] {session.label} stopped")
+                
+            @asyncSlot(int)
+            async def close_session_tab(self, index):
+                """Stop the meeting in a closed tab and drop its transcript."""
+                box = self.transcript_tabs.widget(index)
+                session = self.session_for_box(box)
+                if session is None:
+                    return
+                await self.stop_session(session)
+                self.sessions.remove(session)
+                self.transcript_tabs.removeTab(index)
+                self.log(f"Closed {session.label}")
+                if self.running and not any(s.active for s in self.sessions):
+                    await self.stop()
+                
+            def switch_session(self, index):
+                """Make the meeting in the selected tab the one shown, analyzed and exported."""
+                box = self.transcript_tabs.widget(index)
+                if box is None:
+                    return
+                self.transcript_box = box
+                self.active_session = self.session_for_box(box)
+                if self.active_session is not None:
+                    self.meeting_title = self.active_session.meeting_title
+                    self.topic_value.setText(self.meeting_title)
+                
+            def active_transcript(self):
+                """The transcript store of the meeting in the selected tab."""
+                if self.active_session is None:
+                    return TranscriptStore()
+                return self.active_session.transcript
+                
+            def session_for_box(self, box):
+                """Find the session that owns a transcript box."""
+                for session in self.sessions:
+                    if session.transcript_box is box:
+                        return session
+                return None
+                
+            def session_log(self, session, message):
+                """Log a status message, naming the meeting when several are open."""
+                if len(self.sessions) > 1:
+                    message = f"{session.label}: {message}"
+                self.log(message)
                 
             # --------------------------
             # Main Entry Point
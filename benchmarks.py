@@ -0,0 +1,496 @@
+"""Benchmarks for MeetingAssistantPlus_updated.py, run headless against local pages without Otter.ai or the GUI.
+
+Usage: python benchmarks.py <name> [args], where name is one of the keys of BENCHMARKS.
+"""
+import asyncio
+import collections
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+
+import groq
+from playwright.async_api import async_playwright
+from PyQt5.QtCore import QUrl
+from PyQt5.QtWidgets import QApplication, QTextEdit
+from qasync import QEventLoop
+
+from tests.mock_api import mock_completion_api
+from tests.script_loader import load_script
+
+# load_script registers the script as a module so its helpers can be imported by name
+load_script()
+from MeetingAssistantPlus_updated import (
+    ANALYSIS_SYSTEM_PROMPT, AVAILABLE_MODELS, DEFAULT_ANALYSIS_MAX_TOKENS, DEFAULT_DEDUP_WINDOW,
+    DEFAULT_RECONCILE_WINDOW, DEFAULT_SETTINGS, MESSAGE_OVERHEAD_TOKENS, AnalysisContext, FrameLatencyProbe,
+    LineIdentityIndex, ReplaySource, TranscriptFileParser, TranscriptLine, TranscriptStore,
+    assemble_transcript_context, context_window, create_groq_client, estimate_tokens, extract_transcript_lines_per_element,
+    extract_transcript_records, format_srt_time, format_timestamp, line_identity, make_line_preparer, prompt_budget,
+    reconcile_records, run_scraper_worker, scraper_worker_options, settings,
+)
+
+# --------------------------
+# Transcript Extraction
+# --------------------------
+
+def build_benchmark_transcript_html(line_count):
+    """Build a static Otter-like transcript page with the given number of lines."""
+    rows = []
+    for i in range(line_count):
+        h, remainder = divmod(i * 7, 3600)
+        m, s = divmod(remainder, 60)
+        rows.append(
+            f'<div class="line" data-line-id="line-{i}">'
+            f'<span class="speaker-name">Speaker {i % 3 + 1}</span> '
+            f'<span class="timestamp">{h}:{m:02}:{s:02}</span> '
+            f'<span class="transcript-text">This is benchmark transcript line number {i}.</span>'
+            f'</div>'
+        )
+    return (
+        '<html><body><div id="__next"><div class="transcriptContainer">'
+        + "".join(rows)
+        + '</div></div></body></html>'
+    )
+
+async def benchmark_poll_extraction(line_counts=(100, 500, 2000), repeats=5):
+    """Compare per-element and batched poll latency against a local static page."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        print(f"{'lines':>8} {'per-element (ms)':>18} {'batched (ms)':>14}")
+        for line_count in line_counts:
+            await page.set_content(build_benchmark_transcript_html(line_count))
+            timings = {"per_element": [], "batched": []}
+            for _ in range(repeats):
+                started = time.perf_counter()
+                await extract_transcript_lines_per_element(page)
+                timings["per_element"].append((time.perf_counter() - started) * 1000)
+
+                started = time.perf_counter()
+                await extract_transcript_records(page)
+                timings["batched"].append((time.perf_counter() - started) * 1000)
+            per_element = sorted(timings["per_element"])[repeats // 2]
+            batched = sorted(timings["batched"])[repeats // 2]
+            print(f"{line_count:>8} {per_element:>18.1f} {batched:>14.1f}")
+        await browser.close()
+
+def benchmark_dedup_memory(total_lines=120000, checkpoint=20000):
+    """Track dedup memory over a simulated 8-hour meeting (about four lines a second)."""
+    index = LineIdentityIndex(settings.get("dedup_window", DEFAULT_DEDUP_WINDOW))
+    speakers = ["Alex", "Sam", "Jordan", "Riley"]
+    tracemalloc.start()
+    print(f"{'lines':>8} {'window':>8} {'memory (KB)':>12}")
+    for i in range(1, total_lines + 1):
+        h, remainder = divmod(i // 4, 3600)
+        m, sec = divmod(remainder, 60)
+        index.add(line_identity({
+            "speaker": speakers[i % len(speakers)],
+            "timestamp": f"{h}:{m:02}:{sec:02}",
+            "text": "Yes." if i % 10 == 0 else f"Agenda item {i % 50} needs an owner.",
+        }))
+        if i % checkpoint == 0:
+            current, _ = tracemalloc.get_traced_memory()
+            print(f"{i:>8} {len(index):>8} {current / 1024:>12.0f}")
+    tracemalloc.stop()
+
+async def benchmark_warm_startup(repeats=3, line_count=500):
+    """Compare Start-to-first-line time with a cold browser launch and a pre-launched one."""
+    html = build_benchmark_transcript_html(line_count)
+
+    async def open_first_line(browser):
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.set_content(html)
+        await extract_transcript_records(page)
+        await context.close()
+
+    timings = {"cold": [], "warm": []}
+    for _ in range(repeats):
+        started = time.perf_counter()
+        playwright = await async_playwright().start()
+        browser = await playwright.chromium.launch(headless=True)
+        await open_first_line(browser)
+        timings["cold"].append((time.perf_counter() - started) * 1000)
+        await browser.close()
+        await playwright.stop()
+
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(headless=True)
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await open_first_line(browser)
+        timings["warm"].append((time.perf_counter() - started) * 1000)
+    await browser.close()
+    await playwright.stop()
+
+    print(f"{'browser':>8} {'first line (ms)':>16}")
+    for mode in ("cold", "warm"):
+        print(f"{mode:>8} {sorted(timings[mode])[repeats // 2]:>16.1f}")
+
+# --------------------------
+# Transcript Sources
+# --------------------------
+
+def benchmark_replay_pipeline(line_count=20000, speed=100.0):
+    """Replay a synthetic recording through reconciliation and line cleanup as fast as it is released."""
+    path = os.path.abspath("benchmark_replay.srt")
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(line_count):
+            # Ten lines a second of meeting time, i.e. 1,000 lines a second at 100x
+            file.write(f"{i + 1}\n{format_srt_time(i * 0.1)} --> {format_srt_time(i * 0.1 + 0.1)}\n"
+                       f"Speaker {i % 4}: Line {i} of the recorded meeting about the quarterly plan\n\n")
+    try:
+        source = ReplaySource(path, speed)
+        transcript = TranscriptStore()
+        seen_lines = LineIdentityIndex(settings.get("dedup_window", DEFAULT_DEDUP_WINDOW))
+        recent_lines = collections.deque(maxlen=settings.get("reconcile_window", DEFAULT_RECONCILE_WINDOW))
+        prepare = make_line_preparer(scraper_worker_options(True))
+        read_ms = []
+        started = time.perf_counter()
+        while not source.finished:
+            read_started = time.perf_counter()
+            reconcile_records(source.read(), transcript, seen_lines, recent_lines, prepare)
+            read_ms.append((time.perf_counter() - read_started) * 1000)
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - started
+        read_ms.sort()
+        print(f"Replayed {len(transcript)} of {line_count} lines at {source.speed:g}x in {elapsed:.1f}s "
+              f"({len(transcript) / elapsed:.0f} lines/s)")
+        print(f"Per 50 ms batch: avg {sum(read_ms) / len(read_ms):.2f} ms, "
+              f"p95 {read_ms[int(len(read_ms) * 0.95)]:.2f} ms, max {read_ms[-1]:.2f} ms")
+    finally:
+        os.remove(path)
+
+# --------------------------
+# Meeting Sessions
+# --------------------------
+
+def process_tree_rss_mb():
+    """Resident memory of this process and all of its children in MB, or None off Linux."""
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    rss_kb = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status") as f:
+                fields = dict(line.split(":", 1) for line in f if ":" in line)
+        except OSError:
+            continue
+        children.setdefault(int(fields["PPid"]), []).append(int(entry))
+        rss_kb[int(entry)] = int(fields.get("VmRSS", "0 kB").split()[0])
+    total_kb = 0
+    stack = [os.getpid()]
+    while stack:
+        pid = stack.pop()
+        total_kb += rss_kb.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total_kb / 1024.0
+
+async def benchmark_session_memory(session_count=4, line_count=500):
+    """Measure memory per extra meeting when each shares the browser through its own context."""
+    baseline = process_tree_rss_mb()
+    if baseline is None:
+        print("Memory benchmark needs /proc (Linux)")
+        return
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        previous = process_tree_rss_mb()
+        print(f"Python alone: {baseline:.0f} MB, with browser: {previous:.0f} MB")
+        print(f"{'sessions':>8} {'total (MB)':>12} {'added (MB)':>12}")
+        single_session = None
+        for count in range(1, session_count + 1):
+            context = await browser.new_context()
+            page = await context.new_page()
+            await page.set_content(build_benchmark_transcript_html(line_count))
+            await extract_transcript_records(page)
+            total = process_tree_rss_mb()
+            print(f"{count:>8} {total:>12.0f} {total - previous:>12.0f}")
+            single_session = single_session or total
+            previous = total
+        print(f"{session_count} separate app instances: ~{single_session * session_count:.0f} MB, shared: {previous:.0f} MB")
+        await browser.close()
+
+# --------------------------
+# Scraper Process
+# --------------------------
+
+def build_synthetic_meeting_html(lines_per_second):
+    """A transcript page that keeps appending lines, for load tests without Otter."""
+    return build_benchmark_transcript_html(50).replace("</body>", f"""<script>
+let next = 50;
+const container = document.querySelector(".transcriptContainer");
+setInterval(() => {{
+    const line = document.createElement("div");
+    line.className = "line";
+    line.dataset.lineId = "line-" + next;
+    line.innerHTML = '<span class="speaker-name">Speaker ' + (next % 3 + 1) + '</span> '
+        + '<span class="transcript-text">Synthetic high-rate meeting line number ' + next + '.</span>';
+    container.appendChild(line);
+    next += 1;
+}}, {1000 // lines_per_second});
+</script></body>""")
+
+async def measure_inline_latency(url, view, seconds, options):
+    """Poll and ingest on the GUI event loop while sampling frame latency."""
+    probe = FrameLatencyProbe()
+    probe.start()
+    transcript = TranscriptStore()
+    seen_lines = LineIdentityIndex(options["dedup_window"])
+    recent_lines = collections.deque(maxlen=options["reconcile_window"])
+    prepare = make_line_preparer(options)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        await page.goto(url)
+        emitted = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            records = await extract_transcript_records(page)
+            reconcile_records(records, transcript, seen_lines, recent_lines, prepare)
+            for line in transcript[emitted:]:
+                view.append(line.display_text())
+            emitted = len(transcript)
+            await asyncio.sleep(options["poll_interval"])
+        await browser.close()
+    return probe.stop(), len(transcript)
+
+async def measure_worker_latency(url, view, seconds, options):
+    """Let the scraper process ingest while the GUI loop only renders and samples frame latency."""
+    probe = FrameLatencyProbe()
+    probe.start()
+    connection, worker_connection = multiprocessing.Pipe()
+    worker = multiprocessing.Process(target=run_scraper_worker, args=(url, worker_connection, options), daemon=True)
+    worker.start()
+    worker_connection.close()
+    line_count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        while connection.poll():
+            message = connection.recv()
+            if message[0] == "lines":
+                for fields in message[1]:
+                    view.append(TranscriptLine(*fields).display_text())
+                line_count += len(message[1])
+        await asyncio.sleep(0.02)
+    connection.send(("stop",))
+    worker.join(10)
+    return probe.stop(), line_count
+
+def benchmark_ui_latency(seconds=20, lines_per_second=20):
+    """Compare GUI frame latency during a synthetic high-rate meeting with in-process and out-of-process scraping."""
+    html_path = os.path.abspath("benchmark_meeting.html")
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(build_synthetic_meeting_html(lines_per_second))
+    url = QUrl.fromLocalFile(html_path).toString()
+    options = scraper_worker_options(headless=True)
+    options["poll_interval"] = 0.25
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    view = QTextEdit()
+    view.show()
+    results = {}
+    try:
+        with loop:
+            results["in-process"] = loop.run_until_complete(measure_inline_latency(url, view, seconds, options))
+            view.clear()
+            results["scraper process"] = loop.run_until_complete(measure_worker_latency(url, view, seconds, options))
+    finally:
+        os.remove(html_path)
+
+    print(f"{'mode':>16} {'lines':>6} {'avg (ms)':>9} {'p95 (ms)':>9} {'max (ms)':>9}")
+    for mode, (latency, line_count) in results.items():
+        print(f"{mode:>16} {line_count:>6} {latency['avg_ms']:>9.1f} {latency['p95_ms']:>9.1f} {latency['max_ms']:>9.1f}")
+
+# --------------------------
+# AI Analysis
+# --------------------------
+
+def benchmark_context_tokens(path=None, minutes=90, lines_per_minute=15, analysis_every=10):
+    """Compare prompt tokens per analysis call for the full transcript and the rolling context."""
+    if path:
+        with open(path, encoding="utf-8-sig", errors="replace") as file:
+            parser = TranscriptFileParser(path)
+            records = parser.feed(file.read().splitlines()) + parser.flush()
+    else:
+        records = [
+            {"id": None, "speaker": f"Speaker {i % 4}", "timestamp": format_timestamp(i * 60 / lines_per_minute),
+             "text": f"Line {i}: we went over the rollout plan, the budget for the next quarter and who owns it"}
+            for i in range(minutes * lines_per_minute)
+        ]
+    max_words = settings.get("summary_max_words", 250)
+
+    async def summarize(summary, lines_text):
+        # Offline stand-in for the model: a summary held to max_words, as the summary prompt asks
+        return " ".join((summary + " " + lines_text).split()[-max_words:])
+
+    async def run():
+        prompt_tokens = estimate_tokens(DEFAULT_SETTINGS["prompts"][0]["prompt"])
+        transcript = TranscriptStore()
+        context = AnalysisContext(
+            settings.get("context_recent_lines", 20),
+            settings.get("context_max_recent_lines", 80),
+            settings.get("summary_chunk_lines", 200)
+        )
+        samples = []
+        for i, record in enumerate(records, 1):
+            transcript.append(TranscriptLine.from_record(record))
+            if i % analysis_every:
+                continue
+            full = prompt_tokens + estimate_tokens(transcript.text())
+            await context.compact(transcript, summarize)
+            rolling = prompt_tokens + estimate_tokens(context.build(transcript)[0])
+            context.analysis_done(len(transcript))
+            samples.append((transcript[-1].start or 0.0, full, rolling))
+        return samples
+
+    samples = asyncio.run(run())
+    if not samples:
+        print("Transcript is too short to analyze")
+        return
+    scale = max(full for _, full, _ in samples) / 40 or 1
+    print(f"Prompt tokens per analysis call (one call every {analysis_every} lines); # full transcript, = rolling context")
+    print(f"{'minute':>6} {'full':>8} {'rolling':>8}")
+    step = max(1, len(samples) // 18)
+    for start, full, rolling in samples[step - 1::step]:
+        marker = " > 8192" if full > 8192 else ""
+        print(f"{start / 60:>6.0f} {full:>8} {rolling:>8}  {'=' * int(rolling / scale)}{'#' * int((full - rolling) / scale)}{marker}")
+    print(f"Rolling context peaked at {max(r for _, _, r in samples)} tokens; the full transcript reached {samples[-1][1]}")
+
+def synthetic_transcript(min_tokens):
+    """A transcript of distinct status lines at least min_tokens long, for prompt budget checks."""
+    transcript = TranscriptStore()
+    while not len(transcript) or estimate_tokens(transcript.text()) < min_tokens:
+        for i in range(len(transcript), len(transcript) + 500):
+            transcript.append(TranscriptLine(
+                None, f"Speaker {i % 4}", i * 4.0, None,
+                f"Line {i}: the integration timeline slipped, so we reprioritized the backlog"
+            ))
+    return transcript
+
+def analysis_request_tokens(instructions, context_text):
+    """Tokens an analysis request takes from the window: prompt, system message, chat template and reserved reply."""
+    return (estimate_tokens(f"{instructions}\n\n{context_text}") + estimate_tokens(ANALYSIS_SYSTEM_PROMPT)
+            + MESSAGE_OVERHEAD_TOKENS + DEFAULT_ANALYSIS_MAX_TOKENS)
+
+def benchmark_prompt_budget(overflow=3):
+    """Assemble prompts from transcripts `overflow` times each model's window and time the line cache."""
+    instructions = DEFAULT_SETTINGS["prompts"][0]["prompt"]
+    print(f"{'model':<20} {'window':>7} {'transcript':>11} {'request':>8} {'lines kept':>12} "
+          f"{'newest kept':>12} {'first (ms)':>11} {'cached (ms)':>12}")
+    for model in AVAILABLE_MODELS:
+        window = context_window(model)
+        transcript = synthetic_transcript(window * overflow)
+        budget = prompt_budget(model, instructions)
+        started = time.perf_counter()
+        context_text, dropped = assemble_transcript_context(transcript, budget, heading="Current transcript:")
+        first_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        assemble_transcript_context(transcript, budget, heading="Current transcript:")
+        cached_ms = (time.perf_counter() - started) * 1000
+
+        # The fit itself is asserted by tests/test_prompt_budget.py
+        request_tokens = analysis_request_tokens(instructions, context_text)
+        newest_kept = context_text.endswith(transcript[-1].display_text())
+        print(f"{model:<20} {window:>7} {estimate_tokens(transcript.text()):>11} {request_tokens:>8} "
+              f"{len(transcript) - dropped:>6}/{len(transcript):<5} {str(newest_kept):>12} "
+              f"{first_ms:>11.1f} {cached_ms:>12.1f}")
+
+def benchmark_analysis_blocking(delay=3.0, tick_interval=0.25):
+    """Count poll ticks missed while an analysis request takes `delay` seconds, sync vs async client."""
+    messages = [{"role": "user", "content": "Current transcript:\n[0:00:01] Alice: Hello"}]
+
+    async def measure(request):
+        ticks = 0
+        finished = False
+
+        async def tick():
+            nonlocal ticks
+            while not finished:
+                await asyncio.sleep(tick_interval)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        await request()
+        elapsed = time.perf_counter() - started
+        finished = True
+        await ticker
+        return elapsed, max(0, int(elapsed / tick_interval) - ticks)
+
+    async def run(base_url):
+        sync_client = groq.Groq(api_key="benchmark", base_url=base_url, max_retries=0)
+        async_client = create_groq_client(base_url, "benchmark")
+
+        async def blocking_request():
+            # The previous analysis path: a synchronous call made directly on the event loop
+            sync_client.chat.completions.create(model="mock", messages=messages)
+
+        async def async_request():
+            await async_client.chat.completions.create(model="mock", messages=messages)
+
+        print(f"Mock analysis takes {delay:g}s; the poll timer ticks every {tick_interval * 1000:.0f} ms")
+        print(f"{'client':>8} {'request (s)':>12} {'ticks missed':>13}")
+        for label, request in (("sync", blocking_request), ("async", async_request)):
+            elapsed, missed = await measure(request)
+            print(f"{label:>8} {elapsed:>12.2f} {missed:>13}")
+
+    with mock_completion_api(delay) as (base_url, _):
+        asyncio.run(run(base_url))
+
+def benchmark_prompt_fanout(prompt_count=3, delay=1.5, parallelism=3):
+    """Wall time to answer several prompts on one context, one after another vs concurrently."""
+    async def answer(client, index, semaphore=None):
+        started = time.perf_counter()
+        messages = [{"role": "user", "content": f"Prompt {index}\n\nRecent transcript:\n[0:00:01] Alice: Hello"}]
+        if semaphore is None:
+            await client.chat.completions.create(model="mock", messages=messages)
+        else:
+            async with semaphore:
+                await client.chat.completions.create(model="mock", messages=messages)
+        return time.perf_counter() - started
+
+    async def run(base_url):
+        client = create_groq_client(base_url, "benchmark")
+        started = time.perf_counter()
+        sequential = [await answer(client, index) for index in range(prompt_count)]
+        sequential_wall = time.perf_counter() - started
+        semaphore = asyncio.Semaphore(parallelism)
+        started = time.perf_counter()
+        concurrent = await asyncio.gather(*(answer(client, index, semaphore) for index in range(prompt_count)))
+        concurrent_wall = time.perf_counter() - started
+        print(f"{prompt_count} prompts, mock answers take {delay:g}s, parallelism {parallelism}")
+        print(f"{'mode':>10} {'wall (s)':>9} {'slowest prompt (s)':>19}")
+        print(f"{'sequential':>10} {sequential_wall:>9.2f} {max(sequential):>19.2f}")
+        print(f"{'fan-out':>10} {concurrent_wall:>9.2f} {max(concurrent):>19.2f}")
+
+    with mock_completion_api(delay) as (base_url, _):
+        asyncio.run(run(base_url))
+
+# --------------------------
+# Entry Point
+# --------------------------
+BENCHMARKS = {
+    "poll": lambda: asyncio.run(benchmark_poll_extraction()),
+    "sessions": lambda: asyncio.run(benchmark_session_memory()),
+    "startup": lambda: asyncio.run(benchmark_warm_startup()),
+    "dedup": benchmark_dedup_memory,
+    "ui-latency": benchmark_ui_latency,
+    "replay": benchmark_replay_pipeline,
+    "analysis": benchmark_analysis_blocking,
+    "fanout": benchmark_prompt_fanout,
+    "budget": benchmark_prompt_budget,
+    # Optional transcript file (.txt/.vtt/.srt); a synthetic 90-minute meeting otherwise
+    "context": benchmark_context_tokens,
+}
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        sys.exit(f"usage: python benchmarks.py {{{'|'.join(BENCHMARKS)}}} [transcript file for context]")
+    BENCHMARKS[sys.argv[1]](*sys.argv[2:])
@@ -0,0 +1,74 @@
+"""Shared fixtures: the application's namespace, a Qt application and a windowless MeetingAssistant."""
+import asyncio
+import os
+
+import pytest
+
+from script_loader import load_script as load_module
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def load_script():
+    """The application's namespace, loaded once; skips the tests if a dependency is missing."""
+    try:
+        return vars(load_module())
+    except ImportError as e:
+        pytest.skip(f"application dependency missing: {e}", allow_module_level=True)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The application's namespace."""
+    return load_script()
+
+
+@pytest.fixture(scope="session")
+def qapp(app):
+    """The Qt application widgets and timers need."""
+    return app["QApplication"].instance() or app["QApplication"]([])
+
+
+@pytest.fixture
+def settings(app):
+    """The settings the application reads, reset to the defaults for each test."""
+    app["settings"].clear()
+    app["settings"].update(app["DEFAULT_SETTINGS"])
+    return app["settings"]
+
+
+@pytest.fixture
+def assistant(app, qapp, settings):
+    """A MeetingAssistant with its capture and analysis state but no window, tray or hotkey."""
+
+    class AssistantHarness(app["MeetingAssistant"]):
+        def __init__(self):
+            app["QWidget"].__init__(self)
+            self.running = True
+            self.browsers = {}
+            self.browser_lock = asyncio.Lock()
+            self.sessions = []
+            self.active_session = None
+            self.next_session_id = 1
+            self.groq_client = None
+            self.analysis_stats = {}
+            self.response_cache = app["ResponseCache"](settings.get("response_cache_entries", 64), "", 0)
+            self.signals = app["SignalBridge"]()
+            self.transcript_tabs = app["QTabWidget"]()
+            self.suggested_response_box = app["CustomTextEdit"]()
+            self.insights_box = app["CustomTextEdit"]()
+            self.messages = []
+            self.progress = 0
+            self.emitted = []  # (session, TranscriptLine) in the order they were emitted
+            self.signals.append_transcript.connect(lambda session, line: self.emitted.append((session, line)))
+            self.signals.worker_message.connect(self.on_worker_message)
+
+        def log(self, message):
+            self.messages.append(message)
+
+        def update_progress(self, value):
+            self.progress = value
+
+    harness = AssistantHarness()
+    yield harness
+    harness.running = False
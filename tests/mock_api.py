@@ -0,0 +1,44 @@
+"""A local stand-in for the OpenAI-compatible chat completion API, for tests and benchmarks."""
+import contextlib
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockCompletionHandler(BaseHTTPRequestHandler):
+    """Chat completion endpoint that answers after a fixed delay."""
+
+    delay = 3.0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay)
+        body = json.dumps({
+            "id": "mock", "object": "chat.completion", "created": int(time.time()), "model": "mock",
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "KEY INSIGHTS: mock analysis"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def mock_completion_api(delay):
+    """Serve the mock API on a free local port; yields its base URL and handler class, whose delay can be changed."""
+    handler = type("MockCompletionHandler", (MockCompletionHandler,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", handler
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,70 @@
+"""Load MeetingAssistantPlus_updated.py as a module for the tests and benchmarks.
+
+The application is a single script rather than an importable module, so this
+executes its helper section, the widget classes the assistant uses and the
+MeetingAssistant methods into one module, registered under the script's name
+so `from MeetingAssistantPlus_updated import ...` works afterwards.
+"""
+import ast
+import pathlib
+import sys
+import textwrap
+import types
+
+SCRIPT = pathlib.Path(__file__).resolve().parent.parent / "MeetingAssistantPlus_updated.py"
+MODULE_NAME = SCRIPT.stem
+BANNER = "# --------------------------\n"
+
+
+def script_section(source, start, end, indent):
+    """Dedent the lines from start up to end and parse them with the script's line numbers."""
+    first = source.index(start)
+    block = textwrap.dedent(source[first:source.index(end, first)])
+    assert not block[:1].isspace(), f"{start.strip()} is not indented by {indent}"
+    tree = ast.parse(block)
+    ast.increment_lineno(tree, source.count("\n", 0, first))
+    return tree
+
+
+def compiles(node):
+    """Whether a method compiles on its own; open_settings declares settings global after using it."""
+    try:
+        compile(ast.Module([node], []), str(SCRIPT), "exec")
+    except SyntaxError:
+        return False
+    return True
+
+
+def load_script():
+    """Execute the script's testable sections and return the module; ImportError if a dependency is missing."""
+    if MODULE_NAME in sys.modules:
+        return sys.modules[MODULE_NAME]
+    source = SCRIPT.read_text(encoding="utf-8")
+    module = types.ModuleType(MODULE_NAME)
+    module.__file__ = str(SCRIPT)
+    namespace = vars(module)
+
+    helpers = ast.parse(source[:source.index(BANNER + "# Word Cloud Generator")])
+    for node in helpers.body:
+        # Settings are loaded before DEFAULT_SETTINGS is defined; use the defaults
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "settings" for t in node.targets):
+            continue
+        exec(compile(ast.Module([node], []), str(SCRIPT), "exec"), namespace)
+    namespace["settings"] = dict(namespace["DEFAULT_SETTINGS"])
+
+    widgets = script_section(source, "        class SignalBridge(", "        " + BANNER + "        # WordCloud Window", 8)
+    exec(compile(widgets, str(SCRIPT), "exec"), namespace)
+
+    # Methods after __init__ sit one level out from the class body, between stray build_ui
+    # statements; put the methods back on the class
+    assistant = script_section(
+        source, "            class MeetingAssistant(", "            " + BANNER + "            # Main Entry Point", 12
+    )
+    class_node = assistant.body[0]
+    class_node.body.extend(
+        node for node in assistant.body[1:]
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and compiles(node)
+    )
+    exec(compile(ast.Module([class_node], []), str(SCRIPT), "exec"), namespace)
+    sys.modules[MODULE_NAME] = module
+    return module
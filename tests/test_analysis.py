@@ -0,0 +1,306 @@
+"""AI analysis runs off the event loop's critical path, against a local mock of the completion API."""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mock_api import mock_completion_api
+
+
+@pytest.fixture
+def completion_api(settings, monkeypatch):
+    """A mock chat completion endpoint the analysis client is pointed at; yields the handler class."""
+    with mock_completion_api(0.5) as (base_url, handler):
+        monkeypatch.setenv("GROQ_API_KEY", "test")
+        settings.update(groq_base_url=base_url, analysis_max_retries=0)
+        yield handler
+
+
+def line(index):
+    return {
+        "id": None, "speaker": "Ann", "timestamp": f"0:{index // 60:02}:{index % 60:02}",
+        "text": f"Point {index} on the roadmap."
+    }
+
+
+def test_polling_continues_while_analysis_runs(assistant, settings, completion_api, monkeypatch):
+    monkeypatch.setattr(completion_api, "delay", 3.0)
+    settings.update(stream_analysis=False, summary_line_interval=1000)
+    session = assistant.add_session("https://otter.ai/u/test")
+    assistant.active_session = session
+    tick_interval = 0.25
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5)])
+        loop = asyncio.get_running_loop()
+        ticks = missed = 0
+
+        async def poll_ticks():
+            # Stands in for the poll timer: each tick ingests the line that arrived since the last one
+            nonlocal ticks, missed
+            due = loop.time()
+            while True:
+                due += tick_interval
+                await asyncio.sleep(max(0.0, due - loop.time()))
+                # A tick that only fires once the next one is due has missed it
+                late = int((loop.time() - due) / tick_interval)
+                missed += late
+                due += late * tick_interval
+                ticks += 1
+                await assistant.ingest_transcript_records(session, [line(5 + ticks)])
+
+        ticker = asyncio.create_task(poll_ticks())
+        started = time.perf_counter()
+        assistant.request_analysis("button")
+        await session.analysis.task
+        elapsed = time.perf_counter() - started
+        ticker.cancel()
+        return elapsed, ticks, missed
+
+    elapsed, ticks, missed = asyncio.run(run())
+    assert elapsed >= completion_api.delay
+    # A request made on the event loop would hold every tick until it returned
+    assert missed == 0
+    assert ticks >= int(elapsed / tick_interval) - 1
+    assert len(session.transcript) == 5 + ticks
+    assert assistant.analysis_stats[settings["active_prompt"]]["requests"] == 1
+    assert any("AI analysis complete" in message for message in assistant.messages)
+
+
+def test_shift_click_asks_the_model_again(app, assistant, settings, completion_api, monkeypatch):
+    settings.update(stream_analysis=False, rolling_context=False)
+    session = assistant.add_session("https://otter.ai/u/test")
+    assistant.active_session = session
+    shift = app["Qt"].ShiftModifier
+
+    class Keyboard:
+        modifiers = app["Qt"].NoModifier
+
+        @classmethod
+        def keyboardModifiers(cls):
+            return cls.modifiers
+
+    monkeypatch.setitem(app, "QApplication", Keyboard)
+
+    async def click(modifiers):
+        Keyboard.modifiers = modifiers
+        assistant.on_demand_analysis()
+        await session.analysis.task
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5)])
+        await click(app["Qt"].NoModifier)
+        await click(app["Qt"].NoModifier)
+        await click(shift)
+
+    asyncio.run(run())
+    assert assistant.response_cache.stats["bypassed"] == 1
+    assert assistant.analysis_stats[settings["active_prompt"]]["requests"] == 2
+
+
+def test_cache_bypass_is_kept_by_the_merged_follow_up(app):
+    runs = []
+
+    async def run_analysis(trigger, bypass_cache):
+        runs.append((trigger, bypass_cache))
+        await asyncio.sleep(0.01)
+
+    lines = [0]
+    coordinator = app["AnalysisCoordinator"](run_analysis, lambda: lines[0], stale_after_lines=100)
+
+    async def run():
+        coordinator.request("line count")
+        await asyncio.sleep(0)
+        assert coordinator.request("button", bypass_cache=True) == "queued"
+        coordinator.request("code word")
+        await coordinator.task
+        await asyncio.sleep(0)
+        await coordinator.task
+
+    asyncio.run(run())
+    # Nothing new arrived, but the Shift-click still asks the model again
+    assert runs == [("line count", False), ("button", True)]
+
+
+def test_committed_lines_restart_a_stale_analysis(app, assistant, settings):
+    settings.update(stale_analysis_lines=5, summary_line_interval=1000)
+    session = assistant.add_session("https://otter.ai/u/test")
+    assistant.active_session = session
+    runs = []
+
+    async def run_analysis(session, trigger, bypass_cache=False):
+        runs.append((trigger, len(session.transcript)))
+        await asyncio.sleep(10)
+
+    assistant.run_analysis = run_analysis
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(3)])
+        assistant.request_analysis("button")
+        await asyncio.sleep(0)
+        first = session.analysis.task
+
+        # Lines from the page and from a scraper process both count, with no trigger arriving
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(3, 6)])
+        assert session.analysis.task is first
+        worker_lines = [app["TranscriptLine"](None, "Bob", float(i), None, f"Worker line {i}.") for i in range(2)]
+        assistant.on_worker_message(session, ("lines", [worker.fields() for worker in worker_lines]))
+        await asyncio.gather(first, return_exceptions=True)
+        assert first.cancelled()
+        session.analysis.cancel()
+
+    asyncio.run(run())
+    assert runs == [("button", 3), ("button", 8)]
+    assert session.analysis.counts["button"]["cancelled"] == 1
+
+
+class StreamingClient:
+    """Streams the primary answer a chunk every 10 ms after first_delay seconds; other prompts answer at once."""
+
+    def __init__(self, chunks, answer, first_delay=0.0):
+        self.chunks = chunks
+        self.answer = answer
+        self.first_delay = first_delay
+        self.chat = SimpleNamespace(completions=self)
+
+    async def create(self, stream=False, **request):
+        if not stream:
+            message = SimpleNamespace(content=self.answer)
+            return SimpleNamespace(usage=None, choices=[SimpleNamespace(message=message)])
+        return self.stream()
+
+    def stream(self):
+        client = self
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def __aiter__(self):
+                await asyncio.sleep(client.first_delay)
+                for text in client.chunks:
+                    await asyncio.sleep(0.01)
+                    yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+        return Stream()
+
+
+def test_fanout_answer_waits_for_the_primary_stream(assistant, settings):
+    prompts = settings["prompts"] + [{"name": "Risks", "prompt": "List the risks raised."}]
+    settings.update(prompts=prompts, fanout_prompts=["Risks"], rolling_context=False, response_cache=False)
+    session = assistant.add_session("https://otter.ai/u/test")
+    assistant.active_session = session
+    assistant.signals.stream_analysis.connect(assistant.render_analysis_stream)
+    assistant.groq_client = StreamingClient(
+        ["KEY INSIGHTS: ", "The launch ", "moves to ", "Friday."], "Vendor delay."
+    )
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5)])
+        assistant.request_analysis("button")
+        await session.analysis.task
+
+    asyncio.run(run())
+    insights = assistant.insights_box.toPlainText()
+    assert "The launch moves to Friday." in insights
+    assert insights.index("Friday.") < insights.index("RISKS:") < insights.index("Vendor delay.")
+
+
+def streamed_suggestion(app, assistant, settings, first_delay):
+    """A selected session whose analysis streams a suggested response; three new lines make it stale."""
+    settings.update(stale_analysis_lines=3, summary_line_interval=1000, rolling_context=False, response_cache=False)
+    session = assistant.add_session("https://otter.ai/u/test")
+    assistant.active_session = session
+    assistant.signals.stream_analysis.connect(assistant.render_analysis_stream)
+    assistant.groq_client = StreamingClient(
+        ["SUGGESTED RESPONSE: ", "Tell them", " about", " the plan."], "", first_delay
+    )
+    return session
+
+
+def test_streaming_answer_is_not_restarted(app, assistant, settings):
+    session = streamed_suggestion(app, assistant, settings, first_delay=0.0)
+    box = assistant.suggested_response_box
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5)])
+        assistant.request_analysis("button")
+        first = session.analysis.task
+        while "Tell them" not in box.toPlainText():
+            await asyncio.sleep(0.005)
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5, 10)])
+        assert session.analysis.task is first
+        await first
+
+    asyncio.run(run())
+    assert box.toPlainText().strip() == "SUGGESTED RESPONSE:\nTell them about the plan."
+
+
+def test_stale_answer_is_restarted_before_it_streams(app, assistant, settings):
+    session = streamed_suggestion(app, assistant, settings, first_delay=0.1)
+    box = assistant.suggested_response_box
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5)])
+        assistant.request_analysis("button")
+        first = session.analysis.task
+        await asyncio.sleep(0.01)
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5, 10)])
+        assert session.analysis.task is not first
+        await asyncio.gather(first, return_exceptions=True)
+        assert first.cancelled()
+        await session.analysis.task
+
+    asyncio.run(run())
+    assert session.analysis.counts["button"]["cancelled"] == 1
+    assert box.toPlainText().strip() == "SUGGESTED RESPONSE:\nTell them about the plan."
+
+
+def test_cancelled_analysis_clears_the_progress_bar(app, assistant, settings):
+    session = streamed_suggestion(app, assistant, settings, first_delay=10.0)
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(5)])
+        assistant.request_analysis("button")
+        await asyncio.sleep(0.01)
+        assert assistant.progress == 30
+        # Stop cancels the running request
+        session.analysis.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await session.analysis.task
+
+    asyncio.run(run())
+    assert session.analysis.task.cancelled()
+    assert assistant.progress == 0
+
+
+def test_unchanged_transcript_hits_the_cache_with_the_rolling_context(assistant, settings, completion_api, monkeypatch):
+    monkeypatch.setattr(completion_api, "delay", 0.05)
+    # The default rolling context, with no line-count trigger firing on its own
+    settings.update(stream_analysis=False, summary_line_interval=1000)
+    session = assistant.add_session("https://otter.ai/u/test")
+    assistant.active_session = session
+    summaries = []
+    summarize = assistant.summarize_transcript
+
+    async def counted_summarize(summary, lines_text):
+        summaries.append(lines_text)
+        return await summarize(summary, lines_text)
+
+    monkeypatch.setattr(assistant, "summarize_transcript", counted_summarize)
+
+    async def run():
+        await assistant.ingest_transcript_records(session, [line(i) for i in range(100)])
+        for _ in range(3):
+            assistant.request_analysis("button")
+            await session.analysis.task
+
+    asyncio.run(run())
+    # Only the first press summarizes the older lines and asks the model
+    assert len(summaries) == 1
+    assert assistant.analysis_stats[settings["active_prompt"]]["requests"] == 1
+    assert assistant.response_cache.stats["memory_hits"] == 2
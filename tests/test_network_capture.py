@@ -0,0 +1,62 @@
+"""Handing transcript capture between Otter's network traffic and the page."""
+import asyncio
+
+
+def test_dom_capture_resumes_when_network_stalls(assistant, settings):
+    settings["network_stall_timeout"] = 30
+    session = assistant.add_session("https://otter.ai/u/test")
+
+    async def run():
+        session.line_queue = asyncio.Queue()
+        assistant.queue_network_records(session, [{"id": "1", "speaker": "Ann", "timestamp": "0:00:01", "text": "Hi."}])
+        consumer = asyncio.create_task(assistant.consume_transcript_queue(session))
+        await asyncio.sleep(0)
+
+        # Page lines are ignored while the socket is delivering
+        assistant.on_transcript_push(session, [{"id": None, "speaker": "Ann", "timestamp": "0:00:02", "text": "Page."}])
+        await asyncio.sleep(0)
+        assert [line.text for _, line in assistant.emitted] == ["Hi."]
+
+        # ...and taken again once it has been silent for the stall timeout
+        session.network_records_at -= 31
+        assistant.on_transcript_push(session, [{"id": None, "speaker": "Ann", "timestamp": "0:00:03", "text": "Back."}])
+        await asyncio.sleep(0)
+        consumer.cancel()
+
+    asyncio.run(run())
+    assert [line.text for _, line in assistant.emitted] == ["Hi.", "Back."]
+    assert session.capture_source == "dom"
+    assert any("capturing from the page again" in message for message in assistant.messages)
+
+
+def test_page_lines_after_a_stall_line_up_with_network_lines(assistant, settings):
+    session = assistant.add_session("https://otter.ai/u/test")
+    said = [("Ann", 65.4, "Let's start with the budget."), ("Bob", 71.0, "Sounds good."), ("Ann", 75.2, "Then hiring.")]
+    network = [
+        {"id": f"seg-{i}", "speaker": speaker, "timestamp": "", "start": start, "end": None, "text": text}
+        for i, (speaker, start, text) in enumerate(said)
+    ]
+    # The page has its own element IDs and shows times without the hour
+    page = [
+        {"id": f"line-{i}", "speaker": speaker, "timestamp": f"{int(start) // 60}:{int(start) % 60:02}", "text": f" {text} "}
+        for i, (speaker, start, text) in enumerate(said)
+    ]
+
+    async def run():
+        session.line_queue = asyncio.Queue()
+        assistant.queue_network_records(session, network)
+        consumer = asyncio.create_task(assistant.consume_transcript_queue(session))
+        await asyncio.sleep(0)
+
+        session.network_records_at -= settings["network_stall_timeout"] + 1
+        assistant.on_transcript_push(session, page)
+        assistant.on_transcript_push(
+            session, page + [{"id": "line-3", "speaker": "Bob", "timestamp": "1:20", "text": "Agreed."}]
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        consumer.cancel()
+
+    asyncio.run(run())
+    assert [line.text for _, line in assistant.emitted] == [text for _, _, text in said] + ["Agreed."]
+    assert session.capture_source == "dom"
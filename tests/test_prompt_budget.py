@@ -0,0 +1,37 @@
+"""Analysis requests fit each model's context window and keep the newest transcript line."""
+import pytest
+
+from conftest import load_script
+
+MODELS = load_script()["AVAILABLE_MODELS"]
+
+
+def overflowing_transcript(app, min_tokens):
+    """Distinct status lines, at least min_tokens of them."""
+    transcript = app["TranscriptStore"]()
+    while not len(transcript) or app["estimate_tokens"](transcript.text()) < min_tokens:
+        for i in range(len(transcript), len(transcript) + 500):
+            transcript.append(app["TranscriptLine"](
+                None, f"Speaker {i % 4}", i * 4.0, None,
+                f"Line {i}: the integration timeline slipped, so we reprioritized the backlog"
+            ))
+    return transcript
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_overflowing_transcript_fits_the_window(app, model):
+    instructions = app["DEFAULT_SETTINGS"]["prompts"][0]["prompt"]
+    window = app["context_window"](model)
+    transcript = overflowing_transcript(app, window * 3)
+
+    context_text, dropped = app["assemble_transcript_context"](
+        transcript, app["prompt_budget"](model, instructions), heading="Current transcript:"
+    )
+
+    # Prompt, system message, chat template and the reserved reply all come out of the window
+    estimate = app["estimate_tokens"]
+    request_tokens = (estimate(f"{instructions}\n\n{context_text}") + estimate(app["ANALYSIS_SYSTEM_PROMPT"])
+                      + app["MESSAGE_OVERHEAD_TOKENS"] + app["DEFAULT_ANALYSIS_MAX_TOKENS"])
+    assert dropped > 0
+    assert request_tokens <= window
+    assert context_text.endswith(transcript[-1].display_text())
@@ -0,0 +1,116 @@
+"""Fault injection: kill the meeting page mid-meeting and check the transcript survives the reconnect."""
+import asyncio
+
+import pytest
+
+
+class FakeMeetingPage:
+    """Shows the newest lines of a meeting the way Otter's virtualized transcript does, until it is killed."""
+
+    def __init__(self, app, meeting, visible=20):
+        self.app = app
+        self.meeting = meeting  # grows as the meeting goes on, whether or not a page is watching
+        self.visible = visible
+        self.dead = False
+
+    def check_alive(self):
+        if self.dead:
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    async def evaluate(self, script, arg=None):
+        self.check_alive()
+        assert script == self.app["TRANSCRIPT_EXTRACT_JS"]
+        return [dict(record) for record in self.meeting[-self.visible:]]
+
+    async def query_selector(self, selector):
+        self.check_alive()
+        return object() if selector == self.app["TRANSCRIPT_CONTAINER_SELECTOR"] else None
+
+
+def record(index):
+    return {
+        "id": None,
+        "speaker": f"Speaker {index % 3}",
+        "timestamp": f"0:{index // 60:02}:{index % 60:02}",
+        "text": f"Line {index} of the meeting.",
+    }
+
+
+@pytest.fixture
+def meeting(app, assistant, settings):
+    """A session on a fake page whose reconnect opens a fresh fake page on the same meeting."""
+    settings.update(reconnect_initial_delay=0, reconnect_after_errors=3, adaptive_polling=False)
+    session = assistant.add_session("https://otter.ai/u/test")
+    lines = []
+    session.page = FakeMeetingPage(app, lines)
+
+    async def connect_session(reconnected):
+        reconnected.page = FakeMeetingPage(app, lines)
+
+    assistant.connect_session = connect_session
+    return session, lines
+
+
+async def wait_for_reconnect(session):
+    for _ in range(100):
+        if session.reconnects and not session.reconnecting:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("session was not reconnected")
+
+
+def test_killed_page_is_reconnected_without_losing_or_repeating_lines(assistant, meeting):
+    session, lines = meeting
+
+    async def run():
+        lines.extend(record(i) for i in range(15))
+        await assistant.poll_transcript(session)
+        lines.extend(record(i) for i in range(15, 25))
+        await assistant.poll_transcript(session)
+
+        # The page dies while people keep talking
+        session.page.dead = True
+        for i in range(25, 35):
+            lines.append(record(i))
+            await assistant.poll_transcript(session)
+            await asyncio.sleep(0)  # the poll timer fires between polls
+        await wait_for_reconnect(session)
+
+        await assistant.poll_transcript(session)
+        lines.extend(record(i) for i in range(35, 40))
+        await assistant.poll_transcript(session)
+
+    asyncio.run(run())
+    assert session.reconnects == 1
+    assert [line.text for _, line in assistant.emitted] == [record(i)["text"] for i in range(40)]
+
+
+def test_dead_page_is_reconnected_while_capturing_from_the_network(assistant, meeting):
+    session, lines = meeting
+
+    async def run():
+        session.line_queue = asyncio.Queue()
+        assistant.queue_network_records(session, [dict(record(0), id="n0")])
+        assert session.capture_source == "network"
+
+        session.page.dead = True
+        for _ in range(3):
+            await assistant.poll_transcript(session)
+        await wait_for_reconnect(session)
+
+    asyncio.run(run())
+    assert session.reconnects == 1
+
+
+def test_steady_polls_are_counted_without_logging_each_one(assistant, meeting, capsys):
+    session, lines = meeting
+
+    async def run():
+        for i in range(5):
+            lines.append(record(i))
+            await assistant.poll_transcript(session)
+
+    asyncio.run(run())
+    assert session.poll_stats["polls"] == 5
+    assert "poll" not in capsys.readouterr().out
+    assert assistant.poll_summary(session).startswith("5 polls")
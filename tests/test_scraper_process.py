@@ -0,0 +1,145 @@
+"""Messages from the out-of-process scraper."""
+import asyncio
+
+
+def test_expired_login_restarts_the_worker_headed(assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    started = []
+    assistant.start_scraper_worker = lambda restarted, headless=None: started.append((restarted, headless))
+
+    async def run():
+        assistant.on_worker_message(session, ("login_required",))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert started == [(session, False)]
+    assert any("login has expired" in message for message in assistant.messages)
+
+
+def test_worker_lines_are_emitted(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    line = app["TranscriptLine"](None, "Ann", 5.0, None, "Hello.")
+
+    assistant.on_worker_message(session, ("lines", [line.fields()]))
+    # A replaced process's pipe closing is not reported
+    assistant.on_worker_message(session, ("closed", object()))
+
+    assert [emitted.text for _, emitted in assistant.emitted] == ["Hello."]
+    assert not any("exited" in message for message in assistant.messages)
+
+
+class FakeWorkerPage:
+    """A meeting page in the scraper process's browser; shows the newest lines until it is killed."""
+
+    def __init__(self, app, browser, context):
+        self.app = app
+        self.browser = browser
+        self.context = context
+        self.dead = False
+
+    def check_alive(self):
+        if self.dead:
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    async def goto(self, url, **kwargs):
+        self.check_alive()
+
+    async def wait_for_selector(self, selector, **kwargs):
+        self.check_alive()
+
+    async def query_selector(self, selector):
+        self.check_alive()
+        return object() if selector == self.app["TRANSCRIPT_CONTAINER_SELECTOR"] else None
+
+    async def evaluate(self, script, arg=None):
+        self.check_alive()
+        self.browser.polls += 1
+        if self.browser.polls == 4:
+            self.dead = True  # the renderer crashes mid-meeting
+        self.browser.meeting.append(self.browser.record(len(self.browser.meeting)))
+        return [dict(record) for record in self.browser.meeting[-5:]]
+
+
+class FakeWorkerContext:
+    def __init__(self, app, browser):
+        self.app = app
+        self.browser = browser
+
+    async def new_page(self):
+        page = FakeWorkerPage(self.app, self.browser, self)
+        self.browser.pages.append(page)
+        return page
+
+    async def storage_state(self, path=None):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeWorkerBrowser:
+    def __init__(self, app):
+        self.app = app
+        self.meeting = []
+        self.pages = []
+        self.polls = 0
+
+    @staticmethod
+    def record(index):
+        return {"id": None, "speaker": "Ann", "timestamp": f"0:00:{index:02}", "text": f"Worker line {index}."}
+
+    async def new_context(self, storage_state=None):
+        return FakeWorkerContext(self.app, self)
+
+    def is_connected(self):
+        return True
+
+    async def close(self):
+        pass
+
+
+class FakeConnection:
+    """The GUI's end of the pipe: asks the worker to stop after a number of page polls, or of loop turns."""
+
+    def __init__(self, browser, stop_after_polls, max_turns=50):
+        self.browser = browser
+        self.stop_after_polls = stop_after_polls
+        self.turns_left = max_turns
+        self.sent = []
+
+    def poll(self):
+        self.turns_left -= 1
+        return self.browser.polls >= self.stop_after_polls or self.turns_left < 0
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def test_worker_reopens_a_dead_page_without_repeating_lines(app, settings, monkeypatch, tmp_path):
+    settings.update(reconnect_after_errors=3, reconnect_initial_delay=0, poll_interval=0,
+                    storage_state_path=str(tmp_path / "state.json"))
+    browser = FakeWorkerBrowser(app)
+
+    class FakePlaywright:
+        class chromium:
+            @staticmethod
+            async def launch(headless):
+                return browser
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setitem(app, "async_playwright", FakePlaywright)
+    connection = FakeConnection(browser, stop_after_polls=10)
+
+    asyncio.run(app["scrape_in_worker"]("https://otter.ai/u/test", connection, app["scraper_worker_options"](True)))
+
+    texts = [fields[4] for kind, *rest in connection.sent if kind == "lines" for fields in rest[0]]
+    assert texts == [browser.record(i)["text"] for i in range(len(browser.meeting))]
+    assert len(browser.pages) == 2
+    statuses = [rest[0] for kind, *rest in connection.sent if kind == "status"]
+    assert statuses.count("Transcript page stopped responding. Reopening...") == 1
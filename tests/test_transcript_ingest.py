@@ -0,0 +1,134 @@
+"""Reconciling polled snapshots and emitting each committed line exactly once."""
+
+
+def record(index, speaker="Ann", text=None):
+    return {
+        "id": None,
+        "speaker": speaker,
+        "timestamp": f"0:{index // 60:02}:{index % 60:02}",
+        "text": text or f"Sentence number {index} about the quarterly plan.",
+    }
+
+
+def ingest(app, assistant, session, records):
+    """One poll: reconcile a snapshot into the store, then emit what is past the emitted offset."""
+    app["reconcile_records"](
+        records, session.transcript, session.seen_lines, session.recent_lines, assistant.prepare_transcript_line
+    )
+    return assistant.commit_new_lines(session)
+
+
+def emitted_texts(assistant):
+    return [line.text for _, line in assistant.emitted]
+
+
+def test_repeated_snapshots_emit_each_line_once(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    snapshot = [record(i) for i in range(5)]
+
+    assert len(ingest(app, assistant, session, snapshot)) == 5
+    for _ in range(3):
+        assert ingest(app, assistant, session, snapshot) == []
+
+    assert emitted_texts(assistant) == [r["text"] for r in snapshot]
+    assert session.emitted_offset == len(session.transcript) == 5
+
+
+def test_overlapping_snapshots_emit_only_new_lines(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    records = [record(i) for i in range(30)]
+
+    # A sliding 10-line window that advances by 4 lines per poll, like a virtualized list
+    for start in range(0, 21, 4):
+        ingest(app, assistant, session, records[start:start + 10])
+    ingest(app, assistant, session, records[20:30])
+
+    assert emitted_texts(assistant) == [r["text"] for r in records]
+    assert len(session.transcript) == 30
+
+
+def test_revised_line_is_not_emitted_again(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    partial = record(1, text="We should ship the")
+    ingest(app, assistant, session, [record(0), partial])
+
+    revised = dict(partial, text="We should ship the release on Friday.")
+    assert ingest(app, assistant, session, [record(0), revised, record(2)]) != []
+
+    assert emitted_texts(assistant) == [record(0)["text"], "We should ship the", record(2)["text"]]
+    assert session.transcript[1].text == "We should ship the release on Friday."
+    assert len(session.transcript) == 3
+
+
+def test_snapshot_larger_than_dedup_window_is_not_appended_again(app, assistant, settings):
+    settings["dedup_window"] = 50
+    session = assistant.add_session("https://otter.ai/u/test")
+    snapshot = [record(i) for i in range(60)]
+
+    for _ in range(3):
+        ingest(app, assistant, session, snapshot)
+
+    assert len(session.transcript) == 60
+    assert len(assistant.emitted) == 60
+
+
+def test_repeated_untimed_line_from_one_speaker_is_kept(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    yes = {"id": None, "speaker": "Ann", "timestamp": "", "text": "Yes."}
+    other = {"id": None, "speaker": "Bob", "timestamp": "", "text": "Shall we ship on Friday?"}
+
+    ingest(app, assistant, session, [yes])
+    ingest(app, assistant, session, [yes, other, yes])
+    ingest(app, assistant, session, [yes, other, yes, yes])
+    ingest(app, assistant, session, [yes, other, yes, yes])
+
+    assert emitted_texts(assistant) == ["Yes.", "Shall we ship on Friday?", "Yes.", "Yes."]
+
+
+def test_repeated_line_within_one_batch_is_kept(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    yes = {"id": None, "speaker": "Ann", "timestamp": "", "text": "Yes."}
+
+    ingest(app, assistant, session, [yes, yes])
+
+    assert emitted_texts(assistant) == ["Yes.", "Yes."]
+
+
+def test_two_sentences_at_one_timestamp_are_two_lines(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    first = {"id": None, "speaker": "Ann", "timestamp": "0:01:05", "text": "Let's start with the budget."}
+    second = {"id": None, "speaker": "Ann", "timestamp": "0:01:05", "text": "Then the hiring plan."}
+
+    # Pushed one at a time, so neither batch shows the other line
+    ingest(app, assistant, session, [first])
+    ingest(app, assistant, session, [second])
+    ingest(app, assistant, session, [first, second])
+
+    assert emitted_texts(assistant) == [first["text"], second["text"]]
+
+
+def test_distinct_untimed_lines_are_never_merged(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    snapshot = [
+        {"id": None, "speaker": "Ann", "timestamp": "", "text": f"Distinct sentence {i} about quarterly planning"}
+        for i in range(2000)
+    ]
+
+    for line in snapshot[:1000]:
+        ingest(app, assistant, session, [line])
+    ingest(app, assistant, session, snapshot)
+    ingest(app, assistant, session, snapshot[1500:])
+
+    assert len(session.transcript) == 2000
+    assert emitted_texts(assistant) == [r["text"] for r in snapshot]
+
+
+def test_line_with_the_same_id_is_revised(app, assistant):
+    session = assistant.add_session("https://otter.ai/u/test")
+    line = {"id": "l1", "speaker": "Ann", "timestamp": "0:00:01", "text": "We should"}
+
+    ingest(app, assistant, session, [line])
+    ingest(app, assistant, session, [dict(line, text="We could ship on Friday.")])
+
+    assert len(session.transcript) == 1
+    assert session.transcript[0].text == "We could ship on Friday."
@@ -0,0 +1,42 @@
+"""Choosing between transcript files and Otter meeting pages."""
+import pytest
+
+
+@pytest.mark.parametrize("target", [
+    "https://otter.ai/u/abc",
+    "https://example.com/notes/transcript.txt",
+    "http://example.com/captions.vtt",
+])
+def test_urls_are_meeting_pages(app, target):
+    assert app["open_transcript_source"](target) is None
+
+
+@pytest.mark.parametrize("target, path", [
+    ("meeting.vtt", "meeting.vtt"),
+    ("/tmp/meeting.srt", "/tmp/meeting.srt"),
+    ("file:///tmp/recorder-output", "/tmp/recorder-output"),
+    ("C:\\Recordings\\meeting.txt", "C:\\Recordings\\meeting.txt"),
+])
+def test_local_paths_are_tailed(app, target, path):
+    source = app["open_transcript_source"](target)
+
+    assert isinstance(source, app["FileTailSource"])
+    assert source.path == path
+
+
+def test_source_base_requires_read(app):
+    with pytest.raises(TypeError):
+        app["TranscriptFileSource"]("meeting.txt")
+
+
+@pytest.mark.parametrize("text, targets", [
+    ("https://otter.ai/u/a https://otter.ai/u/b", ["https://otter.ai/u/a", "https://otter.ai/u/b"]),
+    ("https://otter.ai/u/a, https://otter.ai/u/b,", ["https://otter.ai/u/a", "https://otter.ai/u/b"]),
+    ("C:\\My Recordings\\meeting, draft.txt", ["C:\\My Recordings\\meeting, draft.txt"]),
+    ("/home/me/Team Sync.vtt https://otter.ai/u/a", ["/home/me/Team Sync.vtt", "https://otter.ai/u/a"]),
+    ("https://otter.ai/u/a C:\\My Recordings\\meeting.txt", ["https://otter.ai/u/a", "C:\\My Recordings\\meeting.txt"]),
+    ("replay:/tmp/old call.srt@10x file:///tmp/live notes.txt",
+     ["replay:/tmp/old call.srt@10x", "file:///tmp/live notes.txt"]),
+])
+def test_url_field_keeps_paths_with_spaces_and_commas(app, text, targets):
+    assert app["split_meeting_targets"](text) == targets